@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from typing import List
-from app.security.auth import get_current_admin
+from app.security.auth import get_current_admin, forget_user_tokens
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.core.supabase_client import get_supabase_admin
 from app.crud.supabase_crud import supabase_crud
@@ -138,6 +138,9 @@ async def update_user(
         except Exception as e:
             print(f"Auth update failed: {e}")
             raise HTTPException(status_code=400, detail=f"Auth update failed: {str(e)}")
+        # New credentials: stop accepting tokens verified before the change
+        if user_in.email or user_in.password:
+            forget_user_tokens(user_id)
 
     # 2. Update Profile
     try:
@@ -181,6 +184,8 @@ async def delete_user(
         # Auth deletion is the primary source of truth.
         
         supabase_admin.auth.admin.delete_user(str(user_id))
+        forget_user_tokens(user_id)
+        supabase_crud.forget_cached_profile(user_id)
         
         # Optionally cleanup profile if cascade didn't work (requires implementing delete_profile)
         # For now assuming cascade or manual cleanup not strictly required if Auth is gone.
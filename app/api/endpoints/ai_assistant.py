@@ -121,21 +121,18 @@ async def ai_auto_setup(
         )
 
     brand_id: int = brand["id"]
-    topics_created = 0
-    keywords_created = 0
-
-    # 3. Create topics and keywords
-    for topic_data in topics:
-        topic = await crud.create_topic(TopicCreate(name=topic_data.name), brand_id)
-        if not topic:
-            continue
-        topics_created += 1
-        topic_id: int = topic["id"]
-
-        for keyword_text in topic_data.keywords:
-            result = await crud.create_keyword(KeywordCreate(text=keyword_text), topic_id)
-            if result:
-                keywords_created += 1
+
+    # 3. Bulk create all topics in one DB call (rows come back in insert order)
+    created_topics = await crud.bulk_create_topics([t.name for t in topics], brand_id)
+    topics_created = len(created_topics)
+
+    # 4. Bulk create all keywords + junction rows in 3 DB calls
+    pairs = [
+        (topic["id"], kw)
+        for topic_data, topic in zip(topics, created_topics)
+        for kw in topic_data.keywords
+    ]
+    keywords_created = await crud.bulk_create_keywords_for_topics(pairs)
 
     return AIAutoSetupResponse(
         brand_id=brand_id,
@@ -17,10 +17,10 @@ async def get_brands(
     """Get all brands for the current user with topics and keywords"""
     brands = await crud.get_brands_by_profile(current_user.id)
 
-    # Add topics with keywords to each brand
+    # Add topics with keywords to each brand, loaded for all brands in one request
+    topics_by_brand = await crud.get_topics_by_brands([brand["id"] for brand in brands]) or {}
     for brand in brands:
-        topics = await crud.get_topics_by_brand(brand["id"])
-        brand["topics"] = topics
+        brand["topics"] = topics_by_brand.get(brand["id"], [])
 
     return brands
 
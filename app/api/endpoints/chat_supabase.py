@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any, Optional
@@ -64,11 +65,13 @@ async def stream_chat(
         ]
         
         # Get user's context data (brands, recent mentions, etc.)
-        brands = await crud.get_brands_by_profile(current_user.id)
-        recent_mentions = await crud.get_mentions_by_profile(
-            current_user.id,
-            skip=0,
-            limit=50
+        brands, recent_mentions = await asyncio.gather(
+            crud.get_brands_by_profile(current_user.id),
+            crud.get_mentions_by_profile(
+                current_user.id,
+                skip=0,
+                limit=50
+            ),
         )
 
         # Build context for AI with UserContext model (PydanticAI)
@@ -136,21 +139,21 @@ async def chat(
 ):
     """Non-streaming AI chat response (for testing)"""
     try:
-        # Get the user's profile from Supabase
-        profile = await crud.get_profile(current_user.id)
+        # Get the user's profile and context data from Supabase in parallel
+        profile, brands, recent_mentions = await asyncio.gather(
+            crud.get_profile(current_user.id),
+            crud.get_brands_by_profile(current_user.id),
+            crud.get_mentions_by_profile(
+                current_user.id,
+                skip=0,
+                limit=20
+            ),
+        )
         if not profile:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
-        
-        # Get user's context data
-        brands = await crud.get_brands_by_profile(current_user.id)
-        recent_mentions = await crud.get_mentions_by_profile(
-            current_user.id,
-            skip=0,
-            limit=20
-        )
 
         # Build context for AI with UserContext model (PydanticAI)
         context = UserContext(
@@ -87,10 +87,22 @@ async def send_user_digest(
         results = []
         total_sent = 0
         
+        # Load the shared webhook and every brand's unsent mentions up front
+        # instead of one round-trip per brand. A missing webhook becomes {} so
+        # each brand still reports the usual "no webhook" error.
+        webhook_config = await crud.get_webhook_config_by_profile(current_user.id) or {}
+        mentions_by_brand = await crud.get_unsent_mentions_by_brands([brand["id"] for brand in brands]) or {}
+        
         # Process each brand
         for brand in brands:
             try:
-                result = await create_and_send_digest_supabase(crud, brand["id"])
+                result = await create_and_send_digest_supabase(
+                    crud,
+                    brand["id"],
+                    brand=brand,
+                    webhook_config=webhook_config,
+                    unsent_mentions=mentions_by_brand.get(brand["id"]),
+                )
                 results.append({
                     "brand_id": brand["id"],
                     "brand_name": brand["name"],
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from app.schemas.keyword import KeywordCreate, KeywordUpdate
@@ -15,24 +16,16 @@ async def get_keywords_by_topic(
     current_user = Depends(get_current_user)
 ):
     """Get all keywords for a specific topic"""
-    # Check topic ownership
+    # Check topic ownership; get_topic already embeds the topic's keywords
     topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-    
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
+    brand = topic.pop("brand", None) if topic else None
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
         )
     
-    keywords = await crud.get_keywords_by_topic(topic_id)
-    return keywords
+    return topic.get("keywords", [])
 
 @router.post("/topics/{topic_id}/keywords", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def create_keyword(
@@ -44,14 +37,7 @@ async def create_keyword(
     """Create a new keyword for a topic"""
     # Check topic ownership
     topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-    
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
+    brand = topic.pop("brand", None) if topic else None
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,16 +60,9 @@ async def delete_keyword(
     current_user = Depends(get_current_user)
 ):
     """Delete a keyword from a topic"""
-    # Check topic ownership
-    topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
+    # Topic (for ownership) and keyword lookups are independent, so run them together
+    topic, keyword = await asyncio.gather(crud.get_topic(topic_id), crud.get_keyword(keyword_id))
+    brand = topic.pop("brand", None) if topic else None
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,7 +70,6 @@ async def delete_keyword(
         )
 
     # Verify keyword exists
-    keyword = await crud.get_keyword(keyword_id)
     if not keyword:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
 from typing import List, Optional
 from app.security.auth import get_current_user
 from app.core.config import settings
@@ -16,6 +17,8 @@ async def get_mentions(
     topic_id: Optional[int] = Query(None, description="Filter by topic ID"), 
     platform_id: Optional[int] = Query(None, description="Filter by platform ID"),
     read_status: Optional[bool] = Query(None, description="Filter by read status"),
+    before_created_at: Optional[datetime] = Query(None, description="Keyset cursor: created_at of the last mention already loaded"),
+    before_id: Optional[int] = Query(None, description="Keyset cursor: id of the last mention already loaded"),
     crud: SupabaseCRUD = Depends(get_supabase_crud),
     current_user = Depends(get_current_user)
 ):
@@ -30,7 +33,9 @@ async def get_mentions(
         limit=limit,
         brand_id=brand_id,
         platform_id=platform_id,
-        read_status=read_status
+        read_status=read_status,
+        before_created_at=before_created_at,
+        before_id=before_id,
     )
     
     return mentions
@@ -49,7 +54,8 @@ async def mark_mention_as_read(
     if not mention:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mention not found")
 
-    brand = await crud.get_brand(mention.get("brand_id"))
+    # The mention row embeds its brand's owner, so no separate brand lookup is needed
+    brand = mention.get("brand")
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mention not found")
 
@@ -1,14 +1,14 @@
 import asyncio
 import logging
 import uuid
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
+from app.core.config import settings
 from app.core.logging_config import (
-    add_scrape_run_file_handler,
-    remove_scrape_run_file_handler,
+    enable_scrape_run_log,
     reset_current_scrape_run_id,
     set_current_scrape_run_id,
 )
@@ -37,18 +37,21 @@ class UserScrapeResponse(BaseModel):
     brand_results: List[BrandScrapeResponse]
     errors: List[str] = []
 
-@router.post("/brand/{brand_id}", response_model=BrandScrapeResponse)
-async def scrape_brand(
+async def _scrape_brand_core(
     brand_id: int,
-    crud: SupabaseCRUD = Depends(get_supabase_crud),
-    current_user = Depends(get_current_user)
-):
+    crud: SupabaseCRUD,
+    current_user,
+    brand: Optional[Dict[str, Any]] = None,
+    topics: Optional[List[Dict[str, Any]]] = None,
+) -> BrandScrapeResponse:
     """
-    Run scraping process for all keywords in a specific brand scope
-    (Can scrape both active and inactive brands for manual scraping)
+    Scrape one brand owned by current_user.
+    Shared by the brand endpoint and scrape_user so neither goes through the route.
+    scrape_user passes the brand and its topics it already loaded in bulk.
     """
     # Verify brand belongs to current user
-    brand = await crud.get_brand(brand_id)
+    if brand is None:
+        brand = await crud.get_brand(brand_id)
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,12 +59,11 @@ async def scrape_brand(
         )
     scrape_run_id = f"b{brand_id}-{uuid.uuid4().hex[:8]}"
 
-    run_handler = None
     run_context_token = None
 
     try:
         run_context_token = set_current_scrape_run_id(scrape_run_id)
-        run_handler, run_log_path = add_scrape_run_file_handler(scrape_run_id)
+        run_log_path = enable_scrape_run_log(scrape_run_id)
         scraping_logger.info(f"[run:{scrape_run_id}] Per-run log file: {run_log_path}")
         result = await process_brand_scrape(
             brand_id=brand_id,
@@ -69,6 +71,8 @@ async def scrape_brand(
             scrape_run_id=scrape_run_id,
             apply_relevance_filter=True,
             acquire_lock=True,
+            brand=brand,
+            topics=topics,
         )
         return BrandScrapeResponse(
             message=result.message,
@@ -92,11 +96,21 @@ async def scrape_brand(
             errors=[f"Critical error: {str(e)}"]
         )
     finally:
-        if run_handler is not None:
-            remove_scrape_run_file_handler(run_handler)
         if run_context_token is not None:
             reset_current_scrape_run_id(run_context_token)
 
+@router.post("/brand/{brand_id}", response_model=BrandScrapeResponse)
+async def scrape_brand(
+    brand_id: int,
+    crud: SupabaseCRUD = Depends(get_supabase_crud),
+    current_user = Depends(get_current_user)
+):
+    """
+    Run scraping process for all keywords in a specific brand scope
+    (Can scrape both active and inactive brands for manual scraping)
+    """
+    return await _scrape_brand_core(brand_id, crud, current_user)
+
 @router.post("/user", response_model=UserScrapeResponse)
 async def scrape_user(
     crud: SupabaseCRUD = Depends(get_supabase_crud),
@@ -137,11 +151,35 @@ async def scrape_user(
                 errors=["All brands are inactive"]
             )
 
-        # Process active brands in parallel to avoid serial run-time growth.
-        scrape_tasks = [
-            scrape_brand(brand["id"], crud, current_user)
-            for brand in active_brands
-        ]
+        # Load every brand's topics and keywords in one query; each brand scrape
+        # reuses them instead of querying again, and brands without any active
+        # topic keywords are skipped up front. If the bulk load fails, each
+        # brand scrape loads its own topics as before.
+        topics_by_brand = await crud.get_topics_by_brands([brand["id"] for brand in active_brands])
+        if topics_by_brand is not None:
+            brand_ids_with_keywords = {
+                brand_id
+                for brand_id, topics in topics_by_brand.items()
+                if any(topic.get("is_active", True) and topic.get("keywords") for topic in topics)
+            }
+            for brand in active_brands:
+                if brand["id"] not in brand_ids_with_keywords:
+                    global_errors.append(f"Skipped brand '{brand.get('name', 'Unknown')}': no keywords configured")
+            active_brands = [b for b in active_brands if b["id"] in brand_ids_with_keywords]
+        else:
+            topics_by_brand = {}
+
+        # Process active brands in parallel to avoid serial run-time growth,
+        # bounded so one user cannot start every brand's providers at once.
+        semaphore = asyncio.Semaphore(max(1, settings.scraping_user_brand_concurrency))
+
+        async def _scrape_one(brand: Dict[str, Any]) -> BrandScrapeResponse:
+            async with semaphore:
+                return await _scrape_brand_core(
+                    brand["id"], crud, current_user, brand=brand, topics=topics_by_brand.get(brand["id"])
+                )
+
+        scrape_tasks = [_scrape_one(brand) for brand in active_brands]
         scrape_results = await asyncio.gather(*scrape_tasks, return_exceptions=True)
 
         for brand, result in zip(active_brands, scrape_results):
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List
 from app.schemas.topic import TopicCreate, TopicUpdate
 from app.security.auth import get_current_user
@@ -15,16 +16,16 @@ async def get_topics_by_brand(
     current_user = Depends(get_current_user)
 ):
     """Get all topics for a specific brand"""
-    # Check if brand belongs to current user
-    brand = await crud.get_brand(brand_id)
-    if not brand or brand.get("profile_id") != str(current_user.id):
+    # Ownership check and topic fetch in one query; None means the brand isn't the user's
+    topics = await crud.get_topics_for_owned_brand(brand_id, current_user.id)
+    if topics is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Brand not found"
         )
-    
-    topics = await crud.get_topics_by_brand(brand_id)
-    return topics
+
+    # Plain dicts straight from PostgREST: serialize directly instead of re-validating each topic
+    return ORJSONResponse(topics)
 
 @router.get("/{topic_id}", response_model=dict)
 async def get_topic(
@@ -34,14 +35,7 @@ async def get_topic(
 ):
     """Get a specific topic with keywords"""
     topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-    
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
+    brand = topic.pop("brand", None) if topic else None
     if not brand or brand.get("profile_id") != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -82,30 +76,14 @@ async def update_topic(
     current_user = Depends(get_current_user)
 ):
     """Update a topic"""
-    # Get existing topic and check ownership
-    topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-    
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
-    if not brand or brand.get("profile_id") != str(current_user.id):
+    # Ownership is part of the UPDATE filter; no matching row means not found or not owned
+    updated_topic = await crud.update_topic(topic_id, topic_update, profile_id=current_user.id)
+    if not updated_topic:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
         )
     
-    # Update topic in Supabase
-    updated_topic = await crud.update_topic(topic_id, topic_update)
-    if not updated_topic:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update topic"
-        )
-    
     return updated_topic
 
 @router.delete("/{topic_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -115,25 +93,10 @@ async def delete_topic(
     current_user = Depends(get_current_user)
 ):
     """Delete a topic"""
-    # Get existing topic and check ownership
-    topic = await crud.get_topic(topic_id)
-    if not topic:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Topic not found"
-        )
-    
-    # Check brand ownership
-    brand = await crud.get_brand(topic["brand_id"])
-    if not brand or brand.get("profile_id") != str(current_user.id):
+    # Ownership is part of the DELETE filter; no matching row means not found or not owned
+    success = await crud.delete_topic(topic_id, profile_id=current_user.id)
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Topic not found"
-        )
-    
-    success = await crud.delete_topic(topic_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete topic"
         )
\ No newline at end of file
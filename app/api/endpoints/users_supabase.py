@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
-from app.security.auth import get_current_user
+from app.security.auth import get_current_user, forget_token, security
+from app.core.supabase_client import get_supabase_admin
 from app.core.config import settings
 from app.core.supabase_db import get_supabase_crud
 from app.crud.supabase_crud import SupabaseCRUD
@@ -49,4 +52,22 @@ async def update_user_profile(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
-    return updated_profile
\ No newline at end of file
+    return updated_profile
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user = Depends(get_current_user)
+):
+    """End the current session and drop its cached token verification"""
+    token = credentials.credentials
+    forget_token(token)
+    try:
+        await asyncio.to_thread(get_supabase_admin().auth.admin.sign_out, token, "local")
+    except Exception as e:
+        print(f"Logout failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Logout failed"
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,16 +1,18 @@
-from typing import List
+from functools import cached_property
+from typing import List, Tuple
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Settings(BaseSettings):
     supabase_url: str
     supabase_key: SecretStr
     supabase_service_role_key: SecretStr  # Needed for admin operations (creating users)
+    supabase_pool_max_connections: int = 100  # Shared by the anon and service-role clients
+    supabase_pool_max_keepalive: int = 50
+    supabase_pool_timeout_seconds: float = 10.0  # Max wait for a free pooled connection
     deepseek_api_key: SecretStr
     deepseek_model: str = "deepseek-chat"  # DeepSeek V3 model for relevance filtering
+    deepseek_max_concurrency: int = 8  # In-flight relevance checks per filter call
     gnews_api_key: SecretStr
     gnews_max_results: int = 10
     serpapi_key: SecretStr
@@ -19,6 +21,7 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+    verbose_http_logging: bool = False  # DEBUG logs for httpx/httpcore/openai/pydantic_ai (needs debug)
     allowed_origins: str = "http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173"
     scraping_rate_html_rps: float = 1.5
     scraping_rate_api_rps: float = 3.0
@@ -52,14 +55,17 @@ class Settings(BaseSettings):
     scraping_language_filter_enabled: bool = True
     scraping_default_languages: str = "da,no,sv,en"
     scraping_gnews_inter_request_delay_s: float = 1.0
+    scraping_fetch_cache_ttl_seconds: int = 60  # 0 disables reuse of fetched mentions
+    scraping_user_brand_concurrency: int = 5  # Max brands scraped at once by /scraping/user
+    prometheus_multiproc_dir: str = ""  # Set to aggregate metrics across worker processes
 
     @property
     def scraping_default_languages_list(self) -> List[str]:
         return [lang.strip() for lang in self.scraping_default_languages.split(",") if lang.strip()]
 
-    @property
-    def allowed_origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+    @cached_property
+    def allowed_origins_list(self) -> Tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.allowed_origins.split(","))
     
     class Config:
         env_file = ".env"
@@ -1,11 +1,17 @@
 import logging
+import queue
 import sys
+import threading
+from collections import OrderedDict
 from contextvars import ContextVar
 from pathlib import Path
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from time import monotonic
 from typing import Optional
 
+from app.core.config import settings
+
 _scrape_run_id_ctx: ContextVar[Optional[str]] = ContextVar("scrape_run_id", default=None)
 
 
@@ -21,13 +27,15 @@ def get_current_scrape_run_id() -> Optional[str]:
     return _scrape_run_id_ctx.get()
 
 
-class _SpecificRunFilter(logging.Filter):
-    def __init__(self, scrape_run_id: str):
-        super().__init__()
-        self.scrape_run_id = scrape_run_id
+class _ScrapeRunTagFilter(logging.Filter):
+    """Stamp records with the scrape run of the logging task; drop records logged outside a run."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        return get_current_scrape_run_id() == self.scrape_run_id
+        scrape_run_id = get_current_scrape_run_id()
+        if scrape_run_id is None:
+            return False
+        record.scrape_run_id = scrape_run_id
+        return True
 
 
 def _get_logs_dir() -> Path:
@@ -47,29 +55,117 @@ def _detailed_formatter() -> logging.Formatter:
     )
 
 
-def add_scrape_run_file_handler(scrape_run_id: str) -> tuple[RotatingFileHandler, Path]:
+def _scrape_run_log_path(scrape_run_id: str) -> Path:
     runs_dir = _get_logs_dir() / "runs"
     runs_dir.mkdir(exist_ok=True)
-    run_log_path = runs_dir / f"scrape_{scrape_run_id}.log"
+    return runs_dir / f"scrape_{scrape_run_id}.log"
 
-    handler = RotatingFileHandler(
-        run_log_path,
-        maxBytes=5_000_000,  # 5MB per run
-        backupCount=2
-    )
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(_detailed_formatter())
-    handler.addFilter(_SpecificRunFilter(scrape_run_id))
 
-    scraping_logger = logging.getLogger("scraping")
-    scraping_logger.addHandler(handler)
-    return handler, run_log_path
+class _ScrapeRunFileRouter(logging.Handler):
+    """
+    Write each record to its scrape run's log file.
 
+    Files are opened on a run's first record and closed again once they have
+    been idle for a while, or when too many are open at once.
+    """
 
-def remove_scrape_run_file_handler(handler: logging.Handler) -> None:
-    scraping_logger = logging.getLogger("scraping")
-    scraping_logger.removeHandler(handler)
-    handler.close()
+    def __init__(self, max_open_files: int = 32, idle_seconds: float = 300):
+        super().__init__(level=logging.DEBUG)
+        self.setFormatter(_detailed_formatter())
+        self.max_open_files = max_open_files
+        self.idle_seconds = idle_seconds
+        self._run_handlers: "OrderedDict[str, tuple[RotatingFileHandler, float]]" = OrderedDict()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        scrape_run_id = getattr(record, "scrape_run_id", None)
+        if scrape_run_id is None:
+            return
+        now = monotonic()
+        entry = self._run_handlers.pop(scrape_run_id, None)
+        self._close_idle(now)
+        if entry is not None:
+            run_handler = entry[0]
+        else:
+            run_handler = RotatingFileHandler(
+                _scrape_run_log_path(scrape_run_id),
+                maxBytes=5_000_000,  # 5MB per run
+                backupCount=2
+            )
+            run_handler.setFormatter(self.formatter)
+            while len(self._run_handlers) >= self.max_open_files:
+                _, (oldest, _) = self._run_handlers.popitem(last=False)
+                oldest.close()
+        self._run_handlers[scrape_run_id] = (run_handler, now)
+        run_handler.handle(record)
+
+    def _close_idle(self, now: float) -> None:
+        # Entries are kept in last-used order, so idle ones are at the front
+        while self._run_handlers:
+            scrape_run_id, (run_handler, last_used) = next(iter(self._run_handlers.items()))
+            if now - last_used < self.idle_seconds:
+                break
+            del self._run_handlers[scrape_run_id]
+            run_handler.close()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            while self._run_handlers:
+                _, (run_handler, _) = self._run_handlers.popitem(last=False)
+                run_handler.close()
+        finally:
+            self.release()
+            super().close()
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """QueueHandler that owns the listener thread draining its queue into `handlers`."""
+
+    def __init__(self, *handlers: logging.Handler):
+        super().__init__(queue.Queue())
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self._listener_running = True
+
+    def close(self) -> None:
+        try:
+            if self._listener_running:
+                self._listener_running = False
+                self.listener.stop()
+                for handler in self.listener.handlers:
+                    handler.close()
+        finally:
+            super().close()
+
+
+class _ScrapeRunQueueHandler(_ListenerQueueHandler):
+    """Queue in front of the per-run log file router."""
+
+    def __init__(self):
+        super().__init__(_ScrapeRunFileRouter())
+        self.setLevel(logging.DEBUG)
+        # The tag filter must run on the logging side: it reads the logging task's context var
+        self.addFilter(_ScrapeRunTagFilter())
+
+
+_scrape_run_queue_handler: Optional[_ScrapeRunQueueHandler] = None
+_scrape_run_handler_lock = threading.Lock()
+
+
+def enable_scrape_run_log(scrape_run_id: str) -> Path:
+    """
+    Make sure per-run log files are being written and return this run's path.
+
+    One long-lived handler on the "scraping" logger serves every run; records
+    logged while scrape_run_id is the current run go to its file. File writes
+    happen on a listener thread, so logging never blocks the event loop.
+    """
+    global _scrape_run_queue_handler
+    with _scrape_run_handler_lock:
+        if _scrape_run_queue_handler is None:
+            _scrape_run_queue_handler = _ScrapeRunQueueHandler()
+            logging.getLogger("scraping").addHandler(_scrape_run_queue_handler)
+    return _scrape_run_log_path(scrape_run_id)
 
 def setup_logging():
     """
@@ -91,14 +187,23 @@ def setup_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
-    # Clear existing handlers
+    # Clear existing handlers; a queue handler from an earlier call also owns a
+    # listener thread and file handlers, so stop and close it first
+    for handler in root_logger.handlers:
+        if isinstance(handler, _ListenerQueueHandler):
+            handler.close()
     root_logger.handlers.clear()
 
+    # Formatting and writing happen on a listener thread behind one QueueHandler;
+    # logging call sites only enqueue. Thread/process info is never formatted.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Console handler (simple format)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler for all logs (rotating)
     all_logs_file = log_dir / "app.log"
@@ -109,7 +214,6 @@ def setup_logging():
     )
     all_logs_handler.setLevel(logging.INFO)
     all_logs_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(all_logs_handler)
 
     # File handler for scraping logs specifically
     scraping_logger = logging.getLogger("scraping")
@@ -123,7 +227,8 @@ def setup_logging():
     )
     scraping_handler.setLevel(logging.DEBUG)
     scraping_handler.setFormatter(detailed_formatter)
-    scraping_logger.addHandler(scraping_handler)
+    # Scraping records reach the root queue by propagation; only they go to this file
+    scraping_handler.addFilter(logging.Filter("scraping"))
 
     # Error logs file
     error_logs_file = log_dir / "errors.log"
@@ -134,13 +239,18 @@ def setup_logging():
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(error_handler)
 
-    # Enable DEBUG logging for AI and HTTP libraries
-    logging.getLogger('httpx').setLevel(logging.DEBUG)
-    logging.getLogger('httpcore').setLevel(logging.DEBUG)
-    logging.getLogger('pydantic_ai').setLevel(logging.DEBUG)
-    logging.getLogger('openai').setLevel(logging.DEBUG)
+    root_logger.addHandler(
+        _ListenerQueueHandler(console_handler, all_logs_handler, scraping_handler, error_handler)
+    )
+
+    # Per-request DEBUG output from AI and HTTP libraries is opt-in; otherwise
+    # those records are never even created
+    verbose = settings.debug and settings.verbose_http_logging
+    logging.getLogger('httpx').setLevel(logging.DEBUG if verbose else logging.WARNING)
+    logging.getLogger('httpcore').setLevel(logging.DEBUG if verbose else logging.WARNING)
+    logging.getLogger('pydantic_ai').setLevel(logging.DEBUG if verbose else logging.INFO)
+    logging.getLogger('openai').setLevel(logging.DEBUG if verbose else logging.INFO)
 
     logging.info("Logging configured successfully")
     logging.info(f"Logs directory: {log_dir}")
@@ -1,13 +1,19 @@
 """
 Shared Generic CSS Selectors for Web Scraping.
 
-These lists are used as a "best guess" fallback when:
+These tuples are used as a "best guess" fallback when:
 1. No specific source configuration exists for a domain.
 2. A specific configured selector fails to find content.
 3. AI analysis fails to suggest a valid selector.
 """
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
 
-GENERIC_TITLE_SELECTORS = [
+import soupsieve
+
+GENERIC_TITLE_SELECTORS = (
     # --- Social Media Specifics (High Priority: Clean Content) ---
     'h1[slot="title"]',                    # Reddit Modern (Precise title)
     'h1[data-testid="post-title"]',        # Reddit Alternative
@@ -31,9 +37,9 @@ GENERIC_TITLE_SELECTORS = [
     'shreddit-title',                      # Reddit Container (may contain extra elements)
     '[data-testid="tweetText"]',           # Twitter/X fallback (uses text as title if none found)
     'title'                                 # Last resort: page title
-]
+)
 
-GENERIC_CONTENT_SELECTORS = [
+GENERIC_CONTENT_SELECTORS = (
     # --- Social Media Specifics (Priority: Clean text only, no noise) ---
     'div[slot="text-body"]',                  # Reddit Modern (ONLY text, no noise)
     'div[data-click-id="text"]',              # Reddit Alternative
@@ -67,9 +73,9 @@ GENERIC_CONTENT_SELECTORS = [
     'main article',
     'article',
     'main'                                     # Ultimate fallback
-]
+)
 
-GENERIC_DATE_SELECTORS = [
+GENERIC_DATE_SELECTORS = (
     # --- Social Media Specifics ---
     'faceplate-timeago',                         # Reddit Modern
     'time[data-testid="timestamp"]',             # Generic SPAs (Twitter/X)
@@ -95,10 +101,39 @@ GENERIC_DATE_SELECTORS = [
     '.published-date',
     'span[class*="date"]',
     'span[class*="time"]'
-]
+)
 
-GENERIC_SELECTORS_MAP = {
+GENERIC_SELECTORS_MAP = MappingProxyType({
     'title_selector': GENERIC_TITLE_SELECTORS,
     'content_selector': GENERIC_CONTENT_SELECTORS,
     'date_selector': GENERIC_DATE_SELECTORS
-}
\ No newline at end of file
+})
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    Compile a CSS selector once and reuse it across pages and sources.
+
+    Configured and AI-suggested selectors repeat across every page of a
+    source; the compiled pattern matches with pattern.select_one(soup).
+    """
+    return soupsieve.compile(selector)
+
+
+_ATTRIBUTE_BLOCK = re.compile(r"\[[^\]]*\]")
+_SUBJECT_TAG = re.compile(r"^([a-zA-Z][\w-]*)")
+
+
+def selector_subject_tag(selector: str) -> Optional[str]:
+    """
+    Tag name the selector's matched element must have, or None if unknown.
+
+    'div[class*="md"] p' -> 'p', '.date' -> None. Lets callers skip a
+    selector outright on pages that contain no such tag.
+    """
+    if any(ch in selector for ch in ",(|\\"):
+        return None
+    compounds = re.split(r"[\s>+~]+", _ATTRIBUTE_BLOCK.sub("", selector).strip())
+    match = _SUBJECT_TAG.match(compounds[-1])
+    return match.group(1).lower() if match else None
@@ -1,30 +1,80 @@
-from supabase import create_client, Client
+import threading
+
+import httpx
+from supabase import create_client, Client, ClientOptions
 from app.core.config import settings
 
+# One pooled HTTP/2 session serves both Supabase clients, so PostgREST and auth
+# calls from concurrent requests (and worker threads) reuse warm connections.
+SUPABASE_TIMEOUT_SECONDS = 120
+
 class SupabaseClient:
     _instance: Client = None
     _admin_instance: Client = None
-    
+    _http_client: httpx.Client = None
+    # First use can happen concurrently from worker threads; creation is double-checked
+    # under this lock so only one client (and one connection pool) is ever built.
+    _lock = threading.RLock()
+
+    @classmethod
+    def _get_http_client(cls) -> httpx.Client:
+        with cls._lock:
+            if cls._http_client is None:
+                cls._http_client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(
+                        SUPABASE_TIMEOUT_SECONDS,
+                        pool=settings.supabase_pool_timeout_seconds,
+                    ),
+                    limits=httpx.Limits(
+                        max_connections=settings.supabase_pool_max_connections,
+                        max_keepalive_connections=settings.supabase_pool_max_keepalive,
+                    ),
+                )
+            return cls._http_client
+
     @classmethod
     def get_client(cls) -> Client:
         if cls._instance is None:
-            cls._instance = create_client(
-                supabase_url=settings.supabase_url,
-                supabase_key=settings.supabase_key.get_secret_value()
-            )
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = create_client(
+                        supabase_url=settings.supabase_url,
+                        supabase_key=settings.supabase_key.get_secret_value(),
+                        options=ClientOptions(httpx_client=cls._get_http_client()),
+                    )
         return cls._instance
 
     @classmethod
     def get_admin_client(cls) -> Client:
         if cls._admin_instance is None:
-            cls._admin_instance = create_client(
-                supabase_url=settings.supabase_url,
-                supabase_key=settings.supabase_service_role_key.get_secret_value()
-            )
+            with cls._lock:
+                if cls._admin_instance is None:
+                    cls._admin_instance = create_client(
+                        supabase_url=settings.supabase_url,
+                        supabase_key=settings.supabase_service_role_key.get_secret_value(),
+                        options=ClientOptions(httpx_client=cls._get_http_client()),
+                    )
         return cls._admin_instance
 
+    @classmethod
+    def warm_up(cls) -> None:
+        """Build both clients ahead of the first request (clients are created lazily otherwise)."""
+        cls.get_client()
+        cls.get_admin_client()
+
+    @classmethod
+    def close(cls) -> None:
+        """Close the shared connection pool at shutdown; the next use builds fresh clients."""
+        with cls._lock:
+            if cls._http_client is not None:
+                cls._http_client.close()
+            cls._http_client = None
+            cls._instance = None
+            cls._admin_instance = None
+
 def get_supabase() -> Client:
     return SupabaseClient.get_client()
 
 def get_supabase_admin() -> Client:
-    return SupabaseClient.get_admin_client()
\ No newline at end of file
+    return SupabaseClient.get_admin_client()
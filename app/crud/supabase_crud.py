@@ -1,5 +1,8 @@
+import asyncio
 from typing import List, Optional, Dict, Any, Tuple
-from supabase import Client
+from postgrest.types import CountMethod, ReturnMethod
+from supabase import Client, PostgrestAPIError
+from app.core.cache import TTLCache
 from app.core.supabase_client import get_supabase
 from app.schemas import (
     brand as brand_schemas,
@@ -11,20 +14,76 @@ from app.schemas import (
 import uuid
 from datetime import datetime, timedelta
 
+# Each PostgREST upsert runs as a single transaction (one commit), so larger
+# chunks mean fewer commits per scrape while staying well below payload limits.
+MENTION_UPSERT_CHUNK_SIZE = 500
+# Chunk upserts run in worker threads; this bounds how many are in flight.
+MENTION_UPSERT_CONCURRENCY = 4
+# Links travel in the query string of an IN filter, so keep lookups well under URL length limits
+MENTION_LINK_LOOKUP_CHUNK_SIZE = 100
+# Ids also travel in the query string of an IN filter; ~500 short ids stay well under URL limits
+MENTION_ID_CHUNK_SIZE = 500
+# SQLSTATE classes caused by a row's own data (22 data exception, 23 integrity
+# constraint violation); only these are worth bisecting a failed upsert chunk for.
+ROW_DATA_ERROR_SQLSTATE_CLASSES = ("22", "23")
+# Digests only render these columns; skipping content_teaser and the rest keeps a
+# large backlog of unsent mentions small on the wire and in memory.
+UNSENT_MENTION_COLUMNS = "id, brand_id, caption, post_link, created_at, topics(name), platforms(name)"
+# Rows per request when reading unsent mentions for many brands; must not exceed
+# PostgREST's max-rows (1000 on Supabase by default), or a capped page reads as the last.
+UNSENT_MENTION_PAGE_SIZE = 1000
+
+# Platforms are a small, global (not user-scoped) set that almost never changes,
+# so lookups by name are shared across requests for a few minutes. The scrape
+# pipeline resolves every mention's platform through get_or_create_platforms,
+# which serves cached names without a request.
+_platform_cache = TTLCache(maxsize=256, ttl_seconds=300)
+# Brand rows and topic/keyword sets are read several times per scrape but change
+# rarely; keyed by internal brand id and dropped by the write methods below.
+_brand_cache = TTLCache(maxsize=1024, ttl_seconds=60)
+_topics_cache = TTLCache(maxsize=1024, ttl_seconds=60)
+# Profile reads keyed by profile id and refreshed on create/update. Short-lived,
+# since other workers and direct database edits cannot invalidate it; the admin
+# role check bypasses it entirely.
+_profile_cache = TTLCache(maxsize=1024, ttl_seconds=60)
+
+
+def _copy_topics(topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy cached topics so callers can mutate the result without touching the cache."""
+    return [dict(topic, keywords=list(topic.get("keywords") or [])) for topic in topics]
+
+
 class SupabaseCRUD:
     def __init__(self, supabase_client: Optional[Client] = None):
         self.supabase: Client = supabase_client or get_supabase()
 
+    @staticmethod
+    async def _execute_in_thread(query):
+        """Run a blocking PostgREST request in a worker thread so callers can overlap it."""
+        return await asyncio.to_thread(query.execute)
+
     # Profile CRUD
-    async def get_profile(self, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
-        """Get profile by ID"""
+    async def get_profile(self, profile_id: uuid.UUID, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Get profile by ID (use_cache=False always reads the current row)"""
+        if use_cache:
+            cached = _profile_cache.get(str(profile_id))
+            if cached is not None:
+                return dict(cached)
         try:
-            result = self.supabase.table("profiles").select("*").eq("id", str(profile_id)).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("profiles").select("*").eq("id", str(profile_id)))
+            if not result.data:
+                return None
+            _profile_cache.set(str(profile_id), result.data[0])
+            return dict(result.data[0])
         except Exception as e:
             print(f"Error getting profile: {e}")
             return None
 
+    @staticmethod
+    def forget_cached_profile(profile_id: uuid.UUID) -> None:
+        """Drop a cached profile whose row changed outside these methods (e.g. user deleted)"""
+        _profile_cache.pop(str(profile_id))
+
     async def create_profile(self, profile: profile_schemas.ProfileCreate, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Create new profile"""
         try:
@@ -35,28 +94,46 @@ class SupabaseCRUD:
                 "role": profile.role,
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("profiles").insert(data).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("profiles").insert(data))
         except Exception as e:
+            _profile_cache.pop(str(profile_id))
             print(f"Error creating profile: {e}")
             return None
+        # Cache only once the write has landed, so a read that ran during the
+        # insert cannot leave a stale (or missing) profile behind
+        if not result.data:
+            _profile_cache.pop(str(profile_id))
+            return None
+        _profile_cache.set(str(profile_id), result.data[0])
+        return dict(result.data[0])
 
     async def update_profile(self, profile_id: uuid.UUID, profile: profile_schemas.ProfileUpdate) -> Optional[Dict[str, Any]]:
         """Update profile"""
         try:
             data = profile.model_dump(exclude_unset=True, exclude_none=True)
-            result = self.supabase.table("profiles").update(data).eq("id", str(profile_id)).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("profiles").update(data).eq("id", str(profile_id)))
         except Exception as e:
+            _profile_cache.pop(str(profile_id))
             print(f"Error updating profile: {e}")
             return None
+        if not result.data:
+            _profile_cache.pop(str(profile_id))
+            return None
+        _profile_cache.set(str(profile_id), result.data[0])
+        return dict(result.data[0])
 
     # Brand CRUD
     async def get_brand(self, brand_id: int) -> Optional[Dict[str, Any]]:
         """Get brand by ID"""
+        cached = _brand_cache.get(brand_id)
+        if cached is not None:
+            return dict(cached)
         try:
-            result = self.supabase.table("brands").select("*").eq("id", brand_id).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("brands").select("*").eq("id", brand_id))
+            if not result.data:
+                return None
+            _brand_cache.set(brand_id, result.data[0])
+            return dict(result.data[0])
         except Exception as e:
             print(f"Error getting brand: {e}")
             return None
@@ -64,7 +141,9 @@ class SupabaseCRUD:
     async def get_brands_by_profile(self, profile_id: uuid.UUID) -> List[Dict[str, Any]]:
         """Get all brands for a profile"""
         try:
-            result = self.supabase.table("brands").select("*").eq("profile_id", str(profile_id)).execute()
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").select("*").eq("profile_id", str(profile_id))
+            )
             return result.data or []
         except Exception as e:
             print(f"Error getting brands by profile: {e}")
@@ -73,17 +152,55 @@ class SupabaseCRUD:
     async def get_active_brands_for_scheduling(self) -> List[Dict[str, Any]]:
         """Get active brands with scheduling fields for cron usage."""
         try:
-            result = (
+            result = await self._execute_in_thread(
                 self.supabase.table("brands")
                 .select("id, name, profile_id, scrape_frequency_hours, last_scraped_at")
                 .eq("is_active", True)
-                .execute()
             )
             return result.data or []
         except Exception as e:
             print(f"Error getting active brands for scheduling: {e}")
             return []
 
+    async def get_brand_ids_with_keywords(self, brand_ids: List[int]) -> set[int]:
+        """
+        Return the subset of brand_ids that have at least one active topic with a keyword.
+
+        Uses a single inner-joined query so callers can skip empty brands
+        before running the full scrape pipeline for them.
+        """
+        if not brand_ids:
+            return set()
+        try:
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("brand_id, topic_keywords!inner(keyword_id)")
+                .in_("brand_id", brand_ids)
+                .eq("is_active", True)
+            )
+            return {row["brand_id"] for row in result.data or []}
+        except Exception as e:
+            print(f"Error getting brands with keywords: {e}")
+            # Fail open: let the pipeline decide per brand.
+            return set(brand_ids)
+
+    async def get_brands_in(self, brand_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several brands in one request, keyed by id (missing ids are left out)"""
+        if not brand_ids:
+            return {}
+        try:
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").select("*").in_("id", list(brand_ids))
+            )
+            brands = {}
+            for row in result.data or []:
+                _brand_cache.set(row["id"], row)
+                brands[row["id"]] = dict(row)
+            return brands
+        except Exception as e:
+            print(f"Error getting brands: {e}")
+            return {}
+
     async def create_brand(self, brand: brand_schemas.BrandCreate, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Create new brand"""
         try:
@@ -95,7 +212,7 @@ class SupabaseCRUD:
                 "profile_id": str(profile_id),
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("brands").insert(data).execute()
+            result = await self._execute_in_thread(self.supabase.table("brands").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating brand: {e}")
@@ -104,31 +221,32 @@ class SupabaseCRUD:
     async def update_brand(self, brand_id: int, brand: brand_schemas.BrandUpdate, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Update brand (with ownership check)"""
         try:
-            # First check ownership
-            existing = await self.get_brand(brand_id)
-            if not existing or existing.get("profile_id") != str(profile_id):
-                return None
-            
             data = brand.model_dump(exclude_unset=True, exclude_none=True)
-            result = self.supabase.table("brands").update(data).eq("id", brand_id).execute()
+            # Ownership is part of the filter, so a brand owned by someone else
+            # (or a missing one) simply matches no row.
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").update(data).eq("id", brand_id).eq("profile_id", str(profile_id))
+            )
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error updating brand: {e}")
             return None
+        finally:
+            _brand_cache.pop(brand_id)
 
     async def delete_brand(self, brand_id: int, profile_id: uuid.UUID) -> bool:
         """Delete brand (with ownership check)"""
         try:
-            # First check ownership
-            existing = await self.get_brand(brand_id)
-            if not existing or existing.get("profile_id") != str(profile_id):
-                return False
-
-            result = self.supabase.table("brands").delete().eq("id", brand_id).execute()
-            return len(result.data) > 0
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").delete().eq("id", brand_id).eq("profile_id", str(profile_id))
+            )
+            return len(result.data or []) > 0
         except Exception as e:
             print(f"Error deleting brand: {e}")
             return False
+        finally:
+            _brand_cache.pop(brand_id)
+            _topics_cache.pop(brand_id)
 
     async def try_acquire_brand_scrape_lock(
         self,
@@ -145,17 +263,15 @@ class SupabaseCRUD:
             now = datetime.utcnow()
             stale_cutoff = (now - timedelta(minutes=stale_after_minutes)).isoformat()
 
-            # Clear stale lock (best effort)
-            self.supabase.table("brands").update({
-                "scrape_in_progress": False,
-                "scrape_started_at": None
-            }).eq("id", brand_id).eq("scrape_in_progress", True).lt("scrape_started_at", stale_cutoff).execute()
-
-            # Acquire lock if currently free
-            result = self.supabase.table("brands").update({
-                "scrape_in_progress": True,
-                "scrape_started_at": now.isoformat()
-            }).eq("id", brand_id).eq("scrape_in_progress", False).execute()
+            # Acquire lock if currently free or stale, in one conditional update
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").update({
+                    "scrape_in_progress": True,
+                    "scrape_started_at": now.isoformat()
+                }).eq("id", brand_id).or_(
+                    f'scrape_in_progress.eq.false,scrape_started_at.lt."{stale_cutoff}"'
+                )
+            )
 
             return len(result.data or []) > 0
         except Exception as e:
@@ -165,14 +281,18 @@ class SupabaseCRUD:
                 return True
             print(f"Error acquiring brand scrape lock: {e}")
             return False
+        finally:
+            _brand_cache.pop(brand_id)
 
     async def release_brand_scrape_lock(self, brand_id: int) -> bool:
         """Release per-brand scrape lock."""
         try:
-            result = self.supabase.table("brands").update({
-                "scrape_in_progress": False,
-                "scrape_started_at": None
-            }).eq("id", brand_id).execute()
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").update({
+                    "scrape_in_progress": False,
+                    "scrape_started_at": None
+                }).eq("id", brand_id)
+            )
             return len(result.data or []) > 0
         except Exception as e:
             message = str(e).lower()
@@ -180,52 +300,118 @@ class SupabaseCRUD:
                 return True
             print(f"Error releasing brand scrape lock: {e}")
             return False
+        finally:
+            _brand_cache.pop(brand_id)
 
     async def update_brand_last_scraped(self, brand_id: int, last_scraped_at: Optional[datetime] = None) -> bool:
         """Update brand's last_scraped_at timestamp."""
         try:
             timestamp = last_scraped_at or datetime.utcnow()
-            result = self.supabase.table("brands").update({
-                "last_scraped_at": timestamp.isoformat()
-            }).eq("id", brand_id).execute()
+            result = await self._execute_in_thread(
+                self.supabase.table("brands").update({
+                    "last_scraped_at": timestamp.isoformat()
+                }).eq("id", brand_id)
+            )
             return len(result.data) > 0
         except Exception as e:
             print(f"Error updating brand last_scraped_at: {e}")
             return False
+        finally:
+            _brand_cache.pop(brand_id)
 
     # Topic CRUD
     async def get_topic(self, topic_id: int) -> Optional[Dict[str, Any]]:
-        """Get topic by ID with keywords"""
+        """Get topic by ID with keywords and its brand's profile_id (as topic["brand"])"""
         try:
-            result = self.supabase.table("topics").select("*").eq("id", topic_id).execute()
+            # Embed the owning brand and keywords so ownership checks need no second request
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("*, brand:brands(profile_id), topic_keywords(keywords(*))")
+                .eq("id", topic_id)
+            )
             if not result.data:
                 return None
-
-            topic = result.data[0]
-            # Fetch keywords via junction table
-            keywords = await self.get_keywords_by_topic(topic_id)
-            topic["keywords"] = keywords
-            return topic
+            return self._attach_topic_keywords(result.data)[0]
         except Exception as e:
             print(f"Error getting topic: {e}")
             return None
 
     async def get_topics_by_brand(self, brand_id: int) -> List[Dict[str, Any]]:
         """Get all topics for a brand with keywords"""
+        cached = _topics_cache.get(brand_id)
+        if cached is not None:
+            return _copy_topics(cached)
         try:
-            result = self.supabase.table("topics").select("*").eq("brand_id", brand_id).execute()
-            topics = result.data or []
-
-            # Fetch keywords for each topic
-            for topic in topics:
-                keywords = await self.get_keywords_by_topic(topic["id"])
-                topic["keywords"] = keywords
-
+            # Embed keywords through the junction table so topics and keywords come back in one request
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("*, topic_keywords(keywords(*))")
+                .eq("brand_id", brand_id)
+            )
+            topics = self._attach_topic_keywords(result.data or [])
+            _topics_cache.set(brand_id, _copy_topics(topics))
             return topics
         except Exception as e:
             print(f"Error getting topics by brand: {e}")
             return []
 
+    async def get_topics_for_owned_brand(self, brand_id: int, profile_id: uuid.UUID) -> Optional[List[Dict[str, Any]]]:
+        """Get a brand's topics with keywords, or None if the brand does not belong to profile_id"""
+        cached_topics = _topics_cache.get(brand_id)
+        cached_brand = _brand_cache.get(brand_id)
+        if cached_topics is not None and cached_brand is not None:
+            return _copy_topics(cached_topics) if cached_brand.get("profile_id") == str(profile_id) else None
+        try:
+            # Ownership and topics in one request: the inner join drops rows of brands the profile doesn't own
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("*, brands!inner(profile_id), topic_keywords(keywords(*))")
+                .eq("brand_id", brand_id)
+                .eq("brands.profile_id", str(profile_id))
+            )
+            topics = result.data or []
+            for topic in topics:
+                topic.pop("brands", None)
+            if topics:
+                topics = self._attach_topic_keywords(topics)
+                _topics_cache.set(brand_id, _copy_topics(topics))
+                return topics
+        except Exception as e:
+            print(f"Error getting topics for owned brand: {e}")
+        # No rows: tell "owned but no topics" apart from "not this profile's brand"
+        brand = await self.get_brand(brand_id)
+        if not brand or brand.get("profile_id") != str(profile_id):
+            return None
+        return []
+
+    async def get_topics_by_brands(self, brand_ids: List[int]) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """Get topics with keywords for several brands in one request, grouped by brand_id (None on error)"""
+        topics_by_brand: Dict[int, List[Dict[str, Any]]] = {brand_id: [] for brand_id in brand_ids}
+        if not brand_ids:
+            return topics_by_brand
+        try:
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("*, topic_keywords(keywords(*))")
+                .in_("brand_id", brand_ids)
+            )
+            for topic in self._attach_topic_keywords(result.data or []):
+                topics_by_brand.setdefault(topic["brand_id"], []).append(topic)
+            for brand_id, topics in topics_by_brand.items():
+                _topics_cache.set(brand_id, _copy_topics(topics))
+            return topics_by_brand
+        except Exception as e:
+            print(f"Error getting topics by brands: {e}")
+            return None
+
+    @staticmethod
+    def _attach_topic_keywords(topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Flatten embedded topic_keywords(keywords(*)) rows into a topic["keywords"] list."""
+        for topic in topics:
+            links = topic.pop("topic_keywords", None) or []
+            topic["keywords"] = [link["keywords"] for link in links if link.get("keywords")]
+        return topics
+
     async def create_topic(self, topic: topic_schemas.TopicCreate, brand_id: int) -> Optional[Dict[str, Any]]:
         """Create new topic"""
         try:
@@ -236,59 +422,71 @@ class SupabaseCRUD:
                 "is_active": topic.is_active if hasattr(topic, 'is_active') else True,
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("topics").insert(data).execute()
+            result = await self._execute_in_thread(self.supabase.table("topics").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating topic: {e}")
             return None
+        finally:
+            _topics_cache.pop(brand_id)
+
+    async def update_topic(
+        self,
+        topic_id: int,
+        topic: topic_schemas.TopicUpdate,
+        profile_id: Optional[uuid.UUID] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update topic and return the updated row.
 
-    async def update_topic(self, topic_id: int, topic: topic_schemas.TopicUpdate) -> Optional[Dict[str, Any]]:
-        """Update topic"""
+        With profile_id, ownership is part of the UPDATE filter, so a topic the
+        profile doesn't own simply matches no rows and None is returned. An
+        update with no fields only reads the row back (same filters), since an
+        empty PATCH would match nothing.
+        """
+        data = topic.model_dump(exclude_unset=True, exclude_none=True)
+        if not data:
+            try:
+                query = self.supabase.table("topics").select("*").eq("id", topic_id)
+                if profile_id is not None:
+                    query = query.eq("profile_id", str(profile_id))
+                result = await self._execute_in_thread(query.limit(1))
+                return result.data[0] if result.data else None
+            except Exception as e:
+                print(f"Error updating topic: {e}")
+                return None
         try:
-            data = topic.model_dump(exclude_unset=True, exclude_none=True)
-            result = self.supabase.table("topics").update(data).eq("id", topic_id).execute()
+            query = self.supabase.table("topics").update(data).eq("id", topic_id)
+            if profile_id is not None:
+                query = query.eq("profile_id", str(profile_id))
+            result = await self._execute_in_thread(query)
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error updating topic: {e}")
             return None
+        finally:
+            _topics_cache.clear()
+
+    async def delete_topic(self, topic_id: int, profile_id: Optional[uuid.UUID] = None) -> bool:
+        """
+        Delete topic.
 
-    async def delete_topic(self, topic_id: int) -> bool:
-        """Delete topic"""
+        With profile_id, ownership is part of the DELETE filter, so a topic the
+        profile doesn't own simply matches no rows and False is returned.
+        """
         try:
-            result = self.supabase.table("topics").delete().eq("id", topic_id).execute()
-            return len(result.data) > 0
+            query = self.supabase.table("topics").delete().eq("id", topic_id)
+            if profile_id is not None:
+                query = query.eq("profile_id", str(profile_id))
+            result = await self._execute_in_thread(query)
+            return len(result.data or []) > 0
         except Exception as e:
             print(f"Error deleting topic: {e}")
             return False
+        finally:
+            _topics_cache.clear()
 
     # Mention CRUD
-    @staticmethod
-    def _normalize_mention_relations(mention: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize Supabase plural join names to singular keys used by schemas/tools."""
-        normalized = dict(mention)
-        if "brands" in normalized:
-            normalized["brand"] = normalized.pop("brands")
-        if "topics" in normalized:
-            normalized["topic"] = normalized.pop("topics")
-        if "platforms" in normalized:
-            normalized["platform"] = normalized.pop("platforms")
-
-        if "mention_keywords" in normalized:
-            keyword_matches = []
-            for match in normalized.pop("mention_keywords") or []:
-                keyword = match.get("keywords")
-                if keyword:
-                    keyword_matches.append(
-                        {
-                            "keyword": keyword,
-                            "matched_in": match.get("matched_in"),
-                            "score": match.get("score"),
-                        }
-                    )
-            normalized["keyword_matches"] = keyword_matches
-
-        return normalized
-
     async def get_recent_mentions_for_brand_analysis(
         self,
         brand_id: int,
@@ -301,23 +499,21 @@ class SupabaseCRUD:
         cutoff = (datetime.utcnow() - timedelta(days=safe_days_back)).isoformat()
 
         try:
-            result = (
+            result = await self._execute_in_thread(
                 self.supabase.table("mentions")
                 .select(
                     """
                     id, brand_id, topic_id, platform_id, caption, content_teaser, post_link,
                     published_at, created_at, read_status, notified_status,
-                    brands(id, name), topics(id, name), platforms(id, name)
+                    brand:brands(id, name), topic:topics(id, name), platform:platforms(id, name)
                     """
                 )
                 .eq("brand_id", brand_id)
                 .gte("created_at", cutoff)
                 .order("created_at", desc=True)
                 .limit(safe_limit)
-                .execute()
             )
-            rows = result.data or []
-            return [self._normalize_mention_relations(row) for row in rows]
+            return result.data or []
         except Exception as e:
             print(f"Error getting recent mentions for analysis: {e}")
             return []
@@ -325,22 +521,21 @@ class SupabaseCRUD:
     async def get_mention_by_id(self, mention_id: int) -> Optional[Dict[str, Any]]:
         """Fetch a single mention by ID with brand/topic/platform context."""
         try:
-            result = (
+            result = await self._execute_in_thread(
                 self.supabase.table("mentions")
                 .select(
                     """
                     id, brand_id, topic_id, platform_id, caption, content_teaser, post_link,
                     published_at, created_at, read_status, notified_status,
-                    brands(id, name), topics(id, name), platforms(id, name)
+                    brand:brands(id, name, profile_id), topic:topics(id, name), platform:platforms(id, name)
                     """
                 )
                 .eq("id", mention_id)
                 .limit(1)
-                .execute()
             )
             if not result.data:
                 return None
-            return self._normalize_mention_relations(result.data[0])
+            return result.data[0]
         except Exception as e:
             print(f"Error getting mention by id: {e}")
             return None
@@ -348,31 +543,33 @@ class SupabaseCRUD:
     async def get_mentions_by_profile(self, profile_id: uuid.UUID, skip: int = 0, limit: int = 50,
                                     brand_id: Optional[int] = None, platform_id: Optional[int] = None,
                                     read_status: Optional[bool] = None,
-                                    from_date: Optional[datetime] = None, to_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Get mentions with filtering"""
+                                    from_date: Optional[datetime] = None, to_date: Optional[datetime] = None,
+                                    before_created_at: Optional[datetime] = None,
+                                    before_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get mentions with filtering, newest first.
+
+        Pass the created_at and id of the last mention already shown as
+        before_created_at/before_id to get the next page by keyset instead of
+        offset, so deep pages stay an index range scan.
+        """
         try:
-            # First get user's brand IDs
-            brands_result = self.supabase.table("brands").select("id").eq("profile_id", str(profile_id)).execute()
-            user_brand_ids = [brand["id"] for brand in brands_result.data or []]
-            
-            if not user_brand_ids:
-                return []
-            
-            # Filter brand_ids if specific brand requested
-            if brand_id:
-                if brand_id not in user_brand_ids:
-                    return []  # Brand not owned by user
-                user_brand_ids = [brand_id]
-            
-            # Build query for mentions
+            # Inner-joining the brand scopes mentions to the user's brands in the
+            # same request (no separate brand-id lookup); the filter goes through
+            # the embed alias. The inner keyword join only drops match rows whose
+            # keyword is gone, never the mention itself.
             query = self.supabase.table("mentions").select("""
                 *,
-                brands(*),
-                topics(*),
-                platforms(*),
-                mention_keywords(keyword_id, matched_in, score, keywords(*))
-            """).in_("brand_id", user_brand_ids)
-            
+                brand:brands!inner(*),
+                topic:topics(*),
+                platform:platforms(*),
+                keyword_matches:mention_keywords(matched_in, score, keyword:keywords!inner(*))
+            """).eq("brand.profile_id", str(profile_id))
+
+            # A brand the user does not own matches nothing through the join above
+            if brand_id:
+                query = query.eq("brand_id", brand_id)
+
             # Apply additional filters
             if platform_id:
                 query = query.eq("platform_id", platform_id)
@@ -387,12 +584,25 @@ class SupabaseCRUD:
             if to_date:
                 query = query.lte("published_at", to_date.isoformat())
 
-            # Order by created_at descending and apply pagination
-            query = query.order("created_at", desc=True).range(skip, skip + limit - 1)
+            # Keyset cursor: strictly older than (before_created_at, before_id)
+            if before_created_at:
+                cursor_ts = before_created_at.isoformat()
+                if before_id is not None:
+                    query = query.or_(
+                        f'created_at.lt."{cursor_ts}",and(created_at.eq."{cursor_ts}",id.lt.{before_id})'
+                    )
+                else:
+                    query = query.lt("created_at", cursor_ts)
 
-            result = query.execute()
-            mentions = result.data or []
-            return [self._normalize_mention_relations(mention) for mention in mentions]
+            # Order by created_at descending (id breaks ties) and apply pagination
+            query = (
+                query.order("created_at", desc=True)
+                .order("id", desc=True)
+                .range(skip, skip + limit - 1)
+            )
+
+            result = await self._execute_in_thread(query)
+            return result.data or []
         except Exception as e:
             print(f"Error getting mentions: {e}")
             return []
@@ -400,9 +610,9 @@ class SupabaseCRUD:
     async def update_mention_read_status(self, mention_id: int, read_status: bool) -> Optional[Dict[str, Any]]:
         """Update mention read status"""
         try:
-            result = self.supabase.table("mentions").update({
+            result = await self._execute_in_thread(self.supabase.table("mentions").update({
                 "read_status": read_status
-            }).eq("id", mention_id).execute()
+            }).eq("id", mention_id))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error updating mention read status: {e}")
@@ -411,53 +621,61 @@ class SupabaseCRUD:
     # Keyword CRUD
     async def get_keywords_by_topic(self, topic_id: int) -> List[Dict[str, Any]]:
         """Get keywords for a topic via junction table"""
+        keywords_by_topic = await self.get_keywords_by_topics([topic_id])
+        return keywords_by_topic.get(topic_id, [])
+
+    async def get_keywords_by_topics(self, topic_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Get keywords for several topics in one request, grouped by topic_id"""
+        keywords_by_topic: Dict[int, List[Dict[str, Any]]] = {topic_id: [] for topic_id in topic_ids}
+        if not topic_ids:
+            return keywords_by_topic
         try:
-            # Step 1: Get keyword IDs from junction table
-            junction_result = self.supabase.table("topic_keywords").select("keyword_id").eq("topic_id", topic_id).execute()
-
-            if not junction_result.data:
-                return []
-
-            # Step 2: Extract keyword IDs
-            keyword_ids = [item["keyword_id"] for item in junction_result.data]
-
-            if not keyword_ids:
-                return []
-
-            # Step 3: Fetch keywords by IDs
-            keywords_result = self.supabase.table("keywords").select("*").in_("id", keyword_ids).execute()
-
-            return keywords_result.data or []
+            # Embed the keyword rows through the junction table's FK
+            result = await self._execute_in_thread(
+                self.supabase.table("topic_keywords")
+                .select("topic_id, keywords(*)")
+                .in_("topic_id", topic_ids)
+            )
+            for row in result.data or []:
+                keyword = row.get("keywords")
+                if keyword:
+                    keywords_by_topic.setdefault(row["topic_id"], []).append(keyword)
+            return keywords_by_topic
         except Exception as e:
-            print(f"Error getting keywords by topic: {e}")
-            return []
+            print(f"Error getting keywords by topics: {e}")
+            return keywords_by_topic
 
     async def create_keyword(self, keyword: keyword_schemas.KeywordCreate, topic_id: int) -> Optional[Dict[str, Any]]:
         """Create new keyword and link it to topic via junction table"""
         try:
-            # Step 1: Check if keyword already exists (text is UNIQUE)
-            existing = self.supabase.table("keywords").select("*").eq("text", keyword.text).execute()
-
-            if existing.data:
-                # Keyword exists, use it
-                keyword_record = existing.data[0]
-            else:
-                # Create new keyword
-                keyword_data = {
-                    "text": keyword.text,
-                    "created_at": datetime.utcnow().isoformat()
-                }
-                keyword_result = self.supabase.table("keywords").insert(keyword_data).execute()
-                if not keyword_result.data:
-                    return None
-                keyword_record = keyword_result.data[0]
+            # Step 1: Get or create the keyword (text is UNIQUE). ON CONFLICT (text) DO NOTHING
+            # makes a new keyword one round-trip and is safe against concurrent creators;
+            # only an existing keyword needs the follow-up lookup.
+            keyword_data = {
+                "text": keyword.text,
+                "created_at": datetime.utcnow().isoformat()
+            }
+            keyword_result = await self._execute_in_thread(
+                self.supabase.table("keywords").upsert(
+                    keyword_data,
+                    on_conflict="text",
+                    ignore_duplicates=True
+                )
+            )
+            if not keyword_result.data:
+                keyword_result = await self._execute_in_thread(
+                    self.supabase.table("keywords").select("*").eq("text", keyword.text).limit(1)
+                )
+            if not keyword_result.data:
+                return None
+            keyword_record = keyword_result.data[0]
 
             # Step 2: Create relationship in topic_keywords junction table
             junction_data = {
                 "topic_id": topic_id,
                 "keyword_id": keyword_record["id"]
             }
-            junction_result = self.supabase.table("topic_keywords").insert(junction_data).execute()
+            junction_result = await self._execute_in_thread(self.supabase.table("topic_keywords").insert(junction_data))
 
             if not junction_result.data:
                 return None
@@ -467,6 +685,8 @@ class SupabaseCRUD:
         except Exception as e:
             print(f"Error creating keyword: {e}")
             return None
+        finally:
+            _topics_cache.clear()
 
     async def bulk_create_topics(self, names: List[str], brand_id: int) -> List[Dict[str, Any]]:
         """Bulk insert topics for a brand in a single DB call. Returns created records with IDs."""
@@ -476,17 +696,20 @@ class SupabaseCRUD:
                 {"name": name, "brand_id": brand_id, "is_active": True, "created_at": now}
                 for name in names
             ]
-            result = self.supabase.table("topics").insert(rows).execute()
+            result = await self._execute_in_thread(self.supabase.table("topics").insert(rows))
             return result.data or []
         except Exception as e:
             print(f"Error bulk creating topics: {e}")
             return []
+        finally:
+            _topics_cache.pop(brand_id)
 
     async def bulk_create_keywords_for_topics(
         self, pairs: List[Tuple[int, str]]
     ) -> int:
         """
-        Efficiently create keywords and topic_keywords junction rows in 3 DB calls.
+        Efficiently create keywords and topic_keywords junction rows in 3 DB calls
+        (a 4th only when another request created some of the keywords meanwhile).
 
         Args:
             pairs: List of (topic_id, keyword_text) tuples.
@@ -494,23 +717,36 @@ class SupabaseCRUD:
         Returns:
             Number of junction rows created.
         """
+        # A repeated (topic, keyword) pair would fail the whole junction insert
+        pairs = list(dict.fromkeys(pairs))
         if not pairs:
             return 0
         try:
             all_texts = list({text for _, text in pairs})
 
             # 1. Fetch already-existing keywords in one query
-            existing_result = self.supabase.table("keywords").select("id, text").in_("text", all_texts).execute()
+            existing_result = await self._execute_in_thread(self.supabase.table("keywords").select("id, text").in_("text", all_texts))
             text_to_id: Dict[str, int] = {row["text"]: row["id"] for row in (existing_result.data or [])}
 
-            # 2. Insert missing keywords in one batch
+            # 2. Insert missing keywords in one batch. ON CONFLICT (text) DO NOTHING, as in
+            # create_keyword, so a concurrent creator of the same word can't fail the batch;
+            # the rows it won come back from one follow-up lookup.
             missing = [t for t in all_texts if t not in text_to_id]
             if missing:
                 now = datetime.utcnow().isoformat()
                 new_rows = [{"text": t, "created_at": now} for t in missing]
-                new_result = self.supabase.table("keywords").insert(new_rows).execute()
+                new_result = await self._execute_in_thread(
+                    self.supabase.table("keywords").upsert(new_rows, on_conflict="text", ignore_duplicates=True)
+                )
                 for row in (new_result.data or []):
                     text_to_id[row["text"]] = row["id"]
+                raced = [t for t in missing if t not in text_to_id]
+                if raced:
+                    raced_result = await self._execute_in_thread(
+                        self.supabase.table("keywords").select("id, text").in_("text", raced)
+                    )
+                    for row in (raced_result.data or []):
+                        text_to_id[row["text"]] = row["id"]
 
             # 3. Bulk insert junction rows
             junction_rows = [
@@ -520,16 +756,18 @@ class SupabaseCRUD:
             ]
             if not junction_rows:
                 return 0
-            result = self.supabase.table("topic_keywords").insert(junction_rows).execute()
+            result = await self._execute_in_thread(self.supabase.table("topic_keywords").insert(junction_rows))
             return len(result.data or [])
         except Exception as e:
             print(f"Error bulk creating keywords: {e}")
             return 0
+        finally:
+            _topics_cache.clear()
 
     async def get_keyword(self, keyword_id: int) -> Optional[Dict[str, Any]]:
         """Get keyword by ID"""
         try:
-            result = self.supabase.table("keywords").select("*").eq("id", keyword_id).execute()
+            result = await self._execute_in_thread(self.supabase.table("keywords").select("*").eq("id", keyword_id))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error getting keyword: {e}")
@@ -539,27 +777,35 @@ class SupabaseCRUD:
         """Delete keyword relationship from topic (via junction table)"""
         try:
             # Delete from topic_keywords junction table
-            result = self.supabase.table("topic_keywords").delete().eq("topic_id", topic_id).eq("keyword_id", keyword_id).execute()
+            result = await self._execute_in_thread(self.supabase.table("topic_keywords").delete().eq("topic_id", topic_id).eq("keyword_id", keyword_id))
             return len(result.data) > 0
         except Exception as e:
             print(f"Error deleting keyword: {e}")
             return False
+        finally:
+            _topics_cache.clear()
 
     # Platform CRUD
     async def get_platforms(self) -> List[Dict[str, Any]]:
         """Get all platforms"""
         try:
-            result = self.supabase.table("platforms").select("*").execute()
+            result = await self._execute_in_thread(self.supabase.table("platforms").select("*"))
             return result.data or []
         except Exception as e:
             print(f"Error getting platforms: {e}")
             return []
 
     async def get_platform_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get platform by name"""
+        """Get platform by name (cached per process)"""
+        cached = _platform_cache.get(name)
+        if cached is not None:
+            return cached
         try:
-            result = self.supabase.table("platforms").select("*").eq("name", name).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("platforms").select("*").eq("name", name))
+            if not result.data:
+                return None
+            _platform_cache.set(name, result.data[0])
+            return result.data[0]
         except Exception as e:
             print(f"Error getting platform by name: {e}")
             return None
@@ -571,17 +817,70 @@ class SupabaseCRUD:
                 "name": name,
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("platforms").insert(data).execute()
-            return result.data[0] if result.data else None
+            result = await self._execute_in_thread(self.supabase.table("platforms").insert(data))
+            if not result.data:
+                return None
+            _platform_cache.set(name, result.data[0])
+            return result.data[0]
         except Exception as e:
             print(f"Error creating platform: {e}")
             return None
 
+    async def get_or_create_platforms(self, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get or create several platforms by name in as few requests as possible.
+
+        Cached platforms cost nothing, known ones one SELECT ... IN, and only
+        names that are still missing are inserted.
+        Returns {name: platform}; names that could not be resolved are absent.
+        """
+        platforms: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for name in dict.fromkeys(name for name in names if name):
+            cached = _platform_cache.get(name)
+            if cached is not None:
+                platforms[name] = cached
+            else:
+                missing.append(name)
+        if not missing:
+            return platforms
+        try:
+            result = await self._execute_in_thread(self.supabase.table("platforms").select("*").in_("name", missing))
+            found = {row["name"]: row for row in result.data or []}
+
+            new_names = [name for name in missing if name not in found]
+            if new_names:
+                # ON CONFLICT (name) DO NOTHING: only newly created rows come back
+                result = await self._execute_in_thread(
+                    self.supabase.table("platforms").upsert(
+                        [{"name": name} for name in new_names],
+                        on_conflict="name",
+                        ignore_duplicates=True
+                    )
+                )
+                for row in result.data or []:
+                    found[row["name"]] = row
+
+                # Created concurrently by another run between our select and insert
+                raced_names = [name for name in new_names if name not in found]
+                if raced_names:
+                    result = await self._execute_in_thread(self.supabase.table("platforms").select("*").in_("name", raced_names))
+                    for row in result.data or []:
+                        found[row["name"]] = row
+
+            for name, platform in found.items():
+                _platform_cache.set(name, platform)
+            platforms.update(found)
+            return platforms
+        except Exception as e:
+            print(f"Error getting or creating platforms: {e}")
+            return platforms
+
     # Source Config CRUD
     async def get_source_config_by_domain(self, domain: str) -> Optional[Dict[str, Any]]:
         """Get source configuration by domain"""
         try:
-            result = self.supabase.table("source_configs").select("*").eq("domain", domain).execute()
+            result = await self._execute_in_thread(self.supabase.table("source_configs").select("*").eq("domain", domain))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error getting source config by domain: {e}")
@@ -590,7 +889,7 @@ class SupabaseCRUD:
     async def get_all_source_configs(self) -> List[Dict[str, Any]]:
         """Get all source configurations"""
         try:
-            result = self.supabase.table("source_configs").select("*").order("created_at", desc=True).execute()
+            result = await self._execute_in_thread(self.supabase.table("source_configs").select("*").order("created_at", desc=True))
             return result.data or []
         except Exception as e:
             print(f"Error getting all source configs: {e}")
@@ -610,7 +909,7 @@ class SupabaseCRUD:
                     if hasattr(config, field):
                         data[field] = getattr(config, field)
 
-                result = self.supabase.table("source_configs").update(data).eq("domain", config.domain).execute()
+                result = await self._execute_in_thread(self.supabase.table("source_configs").update(data).eq("domain", config.domain))
                 return result.data[0] if result.data else None
             else:
                 # Create new config
@@ -626,7 +925,7 @@ class SupabaseCRUD:
                     "created_at": datetime.utcnow().isoformat(),
                     "updated_at": datetime.utcnow().isoformat()
                 }
-                result = self.supabase.table("source_configs").insert(data).execute()
+                result = await self._execute_in_thread(self.supabase.table("source_configs").insert(data))
                 return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating/updating source config: {e}")
@@ -635,7 +934,7 @@ class SupabaseCRUD:
     async def delete_source_config_by_domain(self, domain: str) -> bool:
         """Delete source configuration by domain"""
         try:
-            result = self.supabase.table("source_configs").delete().eq("domain", domain).execute()
+            result = await self._execute_in_thread(self.supabase.table("source_configs").delete().eq("domain", domain))
             return len(result.data) > 0
         except Exception as e:
             print(f"Error deleting source config: {e}")
@@ -658,24 +957,29 @@ class SupabaseCRUD:
                 "notified_status": mention_data.get("notified_status", False),
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("mentions").insert(data).execute()
+            result = await self._execute_in_thread(self.supabase.table("mentions").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating mention: {e}")
             return None
 
-    async def batch_create_mentions(self, mentions_data: List[Dict[str, Any]]) -> tuple[int, List[str]]:
+    async def batch_create_mentions(
+        self,
+        mentions_data: List[Dict[str, Any]]
+    ) -> tuple[int, List[str], List[Dict[str, Any]]]:
         """
         Create multiple mentions using chunked batch upserts.
         Handles duplicates automatically using the (post_link, topic_id) unique constraint.
         This allows multiple brands to track the same URL.
+
+        Returns (saved count, errors, inserted rows). Rows that already existed
+        are skipped by the upsert and are not part of the inserted rows.
         """
         if not mentions_data:
-            return 0, []
+            return 0, [], []
 
-        total_saved = 0
+        inserted_rows: List[Dict[str, Any]] = []
         errors = []
-        now = datetime.utcnow().isoformat()
         
         # 1. Pre-deduplicate in memory (per topic)
         unique_mentions = {}
@@ -700,58 +1004,69 @@ class SupabaseCRUD:
                 "primary_keyword_id": m.get("primary_keyword_id"),
                 "read_status": m.get("read_status", False),
                 "notified_status": m.get("notified_status", False),
-                "created_at": now
+                # created_at is left to the column default (NOW()) to keep
+                # bulk payloads small.
             })
 
-        # 2. Chunk processing (process 100 mentions at a time)
-        chunk_size = 100
-        for i in range(0, len(data_to_save), chunk_size):
-            chunk = data_to_save[i:i + chunk_size]
-            try:
-                # ignore_duplicates=True means "ON CONFLICT DO NOTHING"
-                # Updated to use composite key (post_link, topic_id)
-                result = self.supabase.table("mentions").upsert(
-                    chunk, 
-                    on_conflict="post_link, topic_id", 
-                    ignore_duplicates=True
-                ).execute()
-                
-                if result.data:
-                    total_saved += len(result.data)
-            except Exception as e:
-                error_msg = f"Chunk error ({i}-{i+chunk_size}): {str(e)}"
-                print(f"❌ {error_msg}")
-                errors.append(error_msg)
+        # 2. Chunk processing (one upsert transaction per chunk, several in flight)
+        chunk_size = MENTION_UPSERT_CHUNK_SIZE
+        semaphore = asyncio.Semaphore(MENTION_UPSERT_CONCURRENCY)
 
-        print(f"✅ Batch complete: {total_saved} new mentions saved ({len(mentions_data) - total_saved} skipped/duplicates)")
-        return total_saved, errors
+        async def upsert_chunk(chunk: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._upsert_mention_chunk, chunk)
 
-    async def get_mentions_by_keys(
-        self,
-        brand_id: int,
-        keys: List[Tuple[str, int]]
-    ) -> Dict[Tuple[str, int], int]:
-        """Fetch mention IDs for (post_link, topic_id) pairs scoped to a brand."""
-        if not keys:
-            return {}
+        chunk_results = await asyncio.gather(*(
+            upsert_chunk(data_to_save[i:i + chunk_size])
+            for i in range(0, len(data_to_save), chunk_size)
+        ))
+        for chunk_rows, chunk_errors in chunk_results:
+            inserted_rows.extend(chunk_rows)
+            errors.extend(chunk_errors)
+
+        total_saved = len(inserted_rows)
+        print(f"✅ Batch complete: {total_saved} new mentions saved ({len(mentions_data) - total_saved} skipped/duplicates)")
+        return total_saved, errors, inserted_rows
 
-        post_links = list({key[0] for key in keys})
-        topic_ids = list({key[1] for key in keys})
-        key_set = set(keys)
+    def _upsert_mention_chunk(self, chunk: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Upsert a chunk of mentions in a single request.
 
+        If PostgREST rejects the chunk because of a row's data (SQLSTATE class
+        22 or 23), it is split in half and retried so that one bad row only fails
+        itself instead of rolling back the whole chunk. Any other error (timeout,
+        permissions, server error) would fail every half the same way, so the
+        chunk fails once.
+        """
         try:
-            result = self.supabase.table("mentions").select(
-                "id, post_link, topic_id"
-            ).eq("brand_id", brand_id).in_("post_link", post_links).in_("topic_id", topic_ids).execute()
-            mentions = result.data or []
-            return {
-                (m["post_link"], m["topic_id"]): m["id"]
-                for m in mentions
-                if (m["post_link"], m["topic_id"]) in key_set
-            }
+            # ignore_duplicates=True means "ON CONFLICT DO NOTHING"
+            # Updated to use composite key (post_link, topic_id)
+            # Only newly inserted rows are returned, including their ids.
+            result = self.supabase.table("mentions").upsert(
+                chunk,
+                on_conflict="post_link, topic_id",
+                ignore_duplicates=True
+            ).execute()
+            return result.data or [], []
+        except PostgrestAPIError as e:
+            if len(chunk) == 1:
+                error_msg = f"Mention error ({chunk[0].get('post_link')}): {str(e)}"
+                print(f"❌ {error_msg}")
+                return [], [error_msg]
+            if not str(e.code or "").startswith(ROW_DATA_ERROR_SQLSTATE_CLASSES):
+                error_msg = f"Chunk error ({len(chunk)} mentions): {str(e)}"
+                print(f"❌ {error_msg}")
+                return [], [error_msg]
         except Exception as e:
-            print(f"Error getting mentions by keys: {e}")
-            return {}
+            # Transport-level failure: retrying halves would only multiply requests.
+            error_msg = f"Chunk error ({len(chunk)} mentions): {str(e)}"
+            print(f"❌ {error_msg}")
+            return [], [error_msg]
+
+        middle = len(chunk) // 2
+        rows_left, errors_left = self._upsert_mention_chunk(chunk[:middle])
+        rows_right, errors_right = self._upsert_mention_chunk(chunk[middle:])
+        return rows_left + rows_right, errors_left + errors_right
 
     async def get_recent_mentions_for_brand(
         self,
@@ -768,14 +1083,14 @@ class SupabaseCRUD:
         cutoff = (datetime.utcnow() - timedelta(days=safe_days_back)).isoformat()
 
         try:
-            result = (
+            # Run off the event loop so callers can overlap it with provider fetching
+            result = await self._execute_in_thread(
                 self.supabase.table("mentions")
                 .select("caption, post_link, content_teaser, published_at, created_at, platforms(name)")
                 .eq("brand_id", brand_id)
                 .gte("created_at", cutoff)
                 .order("created_at", desc=True)
                 .limit(safe_limit)
-                .execute()
             )
             rows = result.data or []
 
@@ -806,20 +1121,44 @@ class SupabaseCRUD:
             print(f"Error getting recent mentions for brand: {e}")
             return []
 
+    async def get_existing_mention_links(self, brand_id: int, links: List[str]) -> set[str]:
+        """
+        Return which of the given post links are already saved for a brand.
+
+        Fails open: on error nothing is reported as existing, so callers keep
+        every mention and rely on insert de-duplication instead.
+        """
+        links = list(dict.fromkeys(link for link in links if link))
+        if not links:
+            return set()
+        try:
+            results = await asyncio.gather(*(
+                self._execute_in_thread(
+                    self.supabase.table("mentions")
+                    .select("post_link")
+                    .eq("brand_id", brand_id)
+                    .in_("post_link", links[start:start + MENTION_LINK_LOOKUP_CHUNK_SIZE])
+                )
+                for start in range(0, len(links), MENTION_LINK_LOOKUP_CHUNK_SIZE)
+            ))
+            return {row["post_link"] for result in results for row in result.data or []}
+        except Exception as e:
+            print(f"Error getting existing mention links: {e}")
+            return set()
+
     async def batch_create_mention_keywords(self, matches: List[Dict[str, Any]]) -> List[str]:
         """Create mention-keyword relations in batch with de-duplication."""
         if not matches:
             return []
 
         errors = []
-        now = datetime.utcnow().isoformat()
+        # created_at is left to the column default (NOW()).
         data_to_save = [
             {
                 "mention_id": m["mention_id"],
                 "keyword_id": m["keyword_id"],
                 "matched_in": m.get("matched_in"),
                 "score": m.get("score"),
-                "created_at": now
             }
             for m in matches
             if m.get("mention_id") and m.get("keyword_id")
@@ -829,11 +1168,13 @@ class SupabaseCRUD:
         for i in range(0, len(data_to_save), chunk_size):
             chunk = data_to_save[i:i + chunk_size]
             try:
-                self.supabase.table("mention_keywords").upsert(
-                    chunk,
-                    on_conflict="mention_id, keyword_id",
-                    ignore_duplicates=True
-                ).execute()
+                await self._execute_in_thread(
+                    self.supabase.table("mention_keywords").upsert(
+                        chunk,
+                        on_conflict="mention_id, keyword_id",
+                        ignore_duplicates=True
+                    )
+                )
             except Exception as e:
                 error_msg = f"Mention-keyword chunk error ({i}-{i+chunk_size}): {str(e)}"
                 print(f"❌ {error_msg}")
@@ -845,26 +1186,23 @@ class SupabaseCRUD:
     async def get_all_user_keywords(self, profile_id: uuid.UUID) -> List[str]:
         """Get all keywords for all active topics of all brands for a user"""
         try:
-            # Get user's brands
-            brands = await self.get_brands_by_profile(profile_id)
-            brand_ids = [brand["id"] for brand in brands]
-            
-            if not brand_ids:
-                return []
-            
-            # Get all active topics for these brands
-            topics_result = self.supabase.table("topics").select("id").in_("brand_id", brand_ids).eq("is_active", True).execute()
-            topic_ids = [topic["id"] for topic in topics_result.data or []]
-            
-            if not topic_ids:
-                return []
-            
-            # Get all keywords for these topics
-            keywords_result = self.supabase.table("keywords").select("word").in_("topic_id", topic_ids).execute()
-            keywords = [kw["word"] for kw in keywords_result.data or []]
-            
+            # One request: the inner-joined brand scopes topics to the user, and the
+            # keyword texts come embedded through topic_keywords.
+            result = await self._execute_in_thread(
+                self.supabase.table("topics")
+                .select("brands!inner(profile_id), topic_keywords(keywords(text))")
+                .eq("brands.profile_id", str(profile_id))
+                .eq("is_active", True)
+            )
+            keywords = [
+                link["keywords"]["text"]
+                for topic in result.data or []
+                for link in topic.get("topic_keywords") or []
+                if link.get("keywords")
+            ]
+
             # Return unique keywords
-            return list(set(keywords))
+            return list(dict.fromkeys(keywords))
         except Exception as e:
             print(f"Error getting user keywords: {e}")
             return []
@@ -873,7 +1211,7 @@ class SupabaseCRUD:
     async def get_webhook_config_by_profile(self, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Get webhook configuration for a profile"""
         try:
-            result = self.supabase.table("integration_configs").select("*").eq("profile_id", str(profile_id)).eq("type", "webhook").execute()
+            result = await self._execute_in_thread(self.supabase.table("integration_configs").select("*").eq("profile_id", str(profile_id)).eq("type", "webhook"))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error getting webhook config: {e}")
@@ -882,23 +1220,84 @@ class SupabaseCRUD:
     async def get_unsent_mentions_by_brand(self, brand_id: int) -> List[Dict[str, Any]]:
         """Get unsent mentions for a brand with topic information"""
         try:
-            result = self.supabase.table("mentions").select("""
-                *,
-                topics(name)
-            """).eq("brand_id", brand_id).eq("notified_status", False).order("created_at", desc=False).execute()
+            result = await self._execute_in_thread(
+                self.supabase.table("mentions")
+                .select(UNSENT_MENTION_COLUMNS)
+                .eq("brand_id", brand_id)
+                .eq("notified_status", False)
+                .order("created_at", desc=False)
+            )
             return result.data or []
         except Exception as e:
             print(f"Error getting unsent mentions: {e}")
             return []
 
-    async def mark_mentions_as_sent(self, mention_ids: List[int]) -> bool:
-        """Mark mentions as sent (notified)"""
+    async def get_unsent_mentions_by_brands(self, brand_ids: List[int]) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """
+        Get unsent mentions for several brands, grouped by brand_id (None on error).
+
+        One query for all brands, read in pages of UNSENT_MENTION_PAGE_SIZE until
+        a short page, so PostgREST's max-rows cap can't cut off the brands that
+        sort last.
+        """
+        mentions_by_brand: Dict[int, List[Dict[str, Any]]] = {brand_id: [] for brand_id in brand_ids}
+        if not brand_ids:
+            return mentions_by_brand
         try:
-            result = self.supabase.table("mentions").update({"notified_status": True}).in_("id", mention_ids).execute()
-            return len(result.data) > 0
+            offset = 0
+            while True:
+                result = await self._execute_in_thread(
+                    self.supabase.table("mentions")
+                    .select(UNSENT_MENTION_COLUMNS)
+                    .in_("brand_id", list(brand_ids))
+                    .eq("notified_status", False)
+                    .order("created_at", desc=False)
+                    .order("id", desc=False)
+                    .range(offset, offset + UNSENT_MENTION_PAGE_SIZE - 1)
+                )
+                page = result.data or []
+                for mention in page:
+                    mentions_by_brand.setdefault(mention["brand_id"], []).append(mention)
+                if len(page) < UNSENT_MENTION_PAGE_SIZE:
+                    return mentions_by_brand
+                offset += len(page)
         except Exception as e:
-            print(f"Error marking mentions as sent: {e}")
-            return False
+            print(f"Error getting unsent mentions by brands: {e}")
+            return None
+
+    async def mark_mentions_as_sent(self, mention_ids: List[int]) -> int:
+        """
+        Mark mentions as sent (notified) and return how many rows were marked.
+
+        One UPDATE per chunk of ids, at most MENTION_UPSERT_CONCURRENCY in
+        flight. Only the affected row count comes back, not the updated rows.
+        A failed chunk is logged and the others still count.
+        """
+        if not mention_ids:
+            return 0
+        semaphore = asyncio.Semaphore(MENTION_UPSERT_CONCURRENCY)
+
+        async def mark_chunk(chunk: List[int]) -> int:
+            async with semaphore:
+                try:
+                    result = await self._execute_in_thread(
+                        self.supabase.table("mentions")
+                        .update({"notified_status": True}, count=CountMethod.exact, returning=ReturnMethod.minimal)
+                        .in_("id", chunk)
+                    )
+                    return result.count or 0
+                except Exception as e:
+                    print(f"Error marking mentions as sent ({len(chunk)} ids): {e}")
+                    return 0
+
+        marked_counts = await asyncio.gather(*(
+            mark_chunk(mention_ids[i:i + MENTION_ID_CHUNK_SIZE])
+            for i in range(0, len(mention_ids), MENTION_ID_CHUNK_SIZE)
+        ))
+        marked = sum(marked_counts)
+        if marked < len(mention_ids):
+            print(f"Marked {marked} of {len(mention_ids)} mentions as sent")
+        return marked
 
     # Chat History CRUD
     async def create_chat(self, user_id: uuid.UUID, title: str = "New Chat") -> Optional[Dict[str, Any]]:
@@ -909,7 +1308,7 @@ class SupabaseCRUD:
                 "title": title,
                 "updated_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("chats").insert(data).execute()
+            result = await self._execute_in_thread(self.supabase.table("chats").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating chat: {e}")
@@ -918,7 +1317,7 @@ class SupabaseCRUD:
     async def get_chats(self, user_id: uuid.UUID) -> List[Dict[str, Any]]:
         """Get all chats for a user"""
         try:
-            result = self.supabase.table("chats").select("*").eq("user_id", str(user_id)).order("updated_at", desc=True).execute()
+            result = await self._execute_in_thread(self.supabase.table("chats").select("*").eq("user_id", str(user_id)).order("updated_at", desc=True))
             return result.data or []
         except Exception as e:
             print(f"Error getting chats: {e}")
@@ -927,15 +1326,16 @@ class SupabaseCRUD:
     async def get_chat_details(self, chat_id: uuid.UUID, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Get chat details with messages"""
         try:
-            # First verify ownership and get chat
-            chat_result = self.supabase.table("chats").select("*").eq("id", str(chat_id)).eq("user_id", str(user_id)).execute()
+            # Load the chat (ownership check) and its messages concurrently;
+            # the messages are discarded unless the chat belongs to the user
+            chat_result, msgs_result = await asyncio.gather(
+                self._execute_in_thread(self.supabase.table("chats").select("*").eq("id", str(chat_id)).eq("user_id", str(user_id))),
+                self._execute_in_thread(self.supabase.table("messages").select("*").eq("chat_id", str(chat_id)).order("created_at", desc=False)),
+            )
             if not chat_result.data:
                 return None
             
             chat = chat_result.data[0]
-            
-            # Get messages
-            msgs_result = self.supabase.table("messages").select("*").eq("chat_id", str(chat_id)).order("created_at", desc=False).execute()
             chat["messages"] = msgs_result.data or []
             
             return chat
@@ -947,7 +1347,7 @@ class SupabaseCRUD:
         """Delete a chat session"""
         try:
             # RLS policies should handle the user_id check, but we add it for safety
-            result = self.supabase.table("chats").delete().eq("id", str(chat_id)).eq("user_id", str(user_id)).execute()
+            result = await self._execute_in_thread(self.supabase.table("chats").delete().eq("id", str(chat_id)).eq("user_id", str(user_id)))
             return len(result.data) > 0
         except Exception as e:
             print(f"Error deleting chat: {e}")
@@ -956,7 +1356,7 @@ class SupabaseCRUD:
     async def update_chat_title(self, chat_id: uuid.UUID, title: str, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Update chat title"""
         try:
-            result = self.supabase.table("chats").update({"title": title, "updated_at": datetime.utcnow().isoformat()}).eq("id", str(chat_id)).eq("user_id", str(user_id)).execute()
+            result = await self._execute_in_thread(self.supabase.table("chats").update({"title": title, "updated_at": datetime.utcnow().isoformat()}).eq("id", str(chat_id)).eq("user_id", str(user_id)))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error updating chat title: {e}")
@@ -971,11 +1371,8 @@ class SupabaseCRUD:
                 "content": content,
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("messages").insert(data).execute()
-            
-            # Update parent chat's updated_at
-            self.supabase.table("chats").update({"updated_at": datetime.utcnow().isoformat()}).eq("id", str(chat_id)).execute()
-            
+            # The parent chat's updated_at is bumped by trg_messages_touch_chat (migration 015)
+            result = await self._execute_in_thread(self.supabase.table("messages").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating message: {e}")
@@ -994,7 +1391,7 @@ class SupabaseCRUD:
                 "brand_id": brand_id,
                 "created_at": datetime.utcnow().isoformat()
             }
-            result = self.supabase.table("generated_reports").insert(data).execute()
+            result = await self._execute_in_thread(self.supabase.table("generated_reports").insert(data))
             return result.data[0] if result.data else None
         except Exception as e:
             print(f"Error creating report: {e}")
@@ -1013,7 +1410,7 @@ class SupabaseCRUD:
                 query = query.eq("brand_id", brand_id)
 
             query = query.order("created_at", desc=True)
-            result = query.execute()
+            result = await self._execute_in_thread(query)
             return result.data or []
         except Exception as e:
             print(f"Error getting reports by user: {e}")
@@ -1022,10 +1419,10 @@ class SupabaseCRUD:
     async def get_report_by_id(self, report_id: uuid.UUID, user_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """Get a specific report by ID (with ownership check)"""
         try:
-            result = self.supabase.table("generated_reports").select("""
+            result = await self._execute_in_thread(self.supabase.table("generated_reports").select("""
                 *,
                 brands(id, name)
-            """).eq("id", str(report_id)).eq("user_id", str(user_id)).execute()
+            """).eq("id", str(report_id)).eq("user_id", str(user_id)))
 
             if result.data:
                 return result.data[0]
@@ -1037,7 +1434,7 @@ class SupabaseCRUD:
     async def delete_report(self, report_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Delete a report (with ownership check)"""
         try:
-            result = self.supabase.table("generated_reports").delete().eq("id", str(report_id)).eq("user_id", str(user_id)).execute()
+            result = await self._execute_in_thread(self.supabase.table("generated_reports").delete().eq("id", str(report_id)).eq("user_id", str(user_id)))
             return len(result.data) > 0
         except Exception as e:
             print(f"Error deleting report: {e}")
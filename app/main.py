@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Response
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_v1 import api_router
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.core.supabase_client import SupabaseClient
+from app.services.scraping.core.http_client import close_shared_async_client
 from app.services.scraping.core.metrics import render_metrics, render_scraping_metrics
 from app.api.dashboard_html import DASHBOARD_HTML
 import logging
@@ -13,11 +15,6 @@ import logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# httpx/httpcore log level: verbose in debug mode, silent in production
-_http_log_level = logging.DEBUG if settings.debug else logging.WARNING
-logging.getLogger('httpx').setLevel(_http_log_level)
-logging.getLogger('httpcore').setLevel(_http_log_level)
-
 
 def _log_scraping_provider_toggles() -> None:
     providers = {
@@ -39,7 +36,10 @@ def _log_scraping_provider_toggles() -> None:
 async def lifespan(app: FastAPI):
     logger.info("TrackAnything Admin API starting...")
     _log_scraping_provider_toggles()
+    SupabaseClient.warm_up()
     yield
+    await close_shared_async_client()
+    SupabaseClient.close()
 
 
 app = FastAPI(
@@ -49,6 +49,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
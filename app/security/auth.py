@@ -1,11 +1,69 @@
+import asyncio
+import hashlib
+import time
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.cache import TTLCache
 from app.core.supabase_client import get_supabase
-from typing import Optional
+from typing import Dict, Optional, Set
+from jose import jwt
 from app.crud.supabase_crud import supabase_crud
 
 security = HTTPBearer()
 
+# Verified users keyed by a hash of their bearer token, so a client's burst of
+# requests costs one round-trip to Supabase Auth per minute instead of one each.
+# An entry never outlives the token's own exp claim, and forget_user_tokens()
+# drops a user's entries when their account changes or they log out.
+_verified_user_cache = TTLCache(maxsize=10_000, ttl_seconds=60)
+# User id -> hashes of that user's cached tokens
+_user_token_keys: Dict[str, Set[str]] = {}
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _token_cache_ttl(token: str) -> float:
+    """Seconds the verified token may stay cached: the cache TTL, capped at its exp."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except Exception:
+        return 0.0
+    if not isinstance(exp, (int, float)):
+        return 0.0
+    return min(_verified_user_cache.ttl_seconds, exp - time.time())
+
+
+def _cache_verified_user(token_key: str, user, ttl_seconds: float) -> None:
+    _verified_user_cache.set(token_key, user, ttl_seconds=ttl_seconds)
+    user_id = str(user.id)
+    # Keep only keys that are still cached, so the index shrinks with the cache
+    live_keys = {key for key in _user_token_keys.get(user_id, ()) if _verified_user_cache.get(key) is not None}
+    live_keys.add(token_key)
+    _user_token_keys[user_id] = live_keys
+    if len(_user_token_keys) > _verified_user_cache.maxsize:
+        for stale_user_id in [
+            uid for uid, keys in _user_token_keys.items()
+            if all(_verified_user_cache.get(key) is None for key in keys)
+        ]:
+            del _user_token_keys[stale_user_id]
+
+
+def forget_token(token: str) -> None:
+    """Drop one token's cached verification (e.g. on logout)."""
+    token_key = _token_key(token)
+    _verified_user_cache.pop(token_key)
+    for keys in _user_token_keys.values():
+        keys.discard(token_key)
+
+
+def forget_user_tokens(user_id) -> None:
+    """Drop every cached verification for a user (deleted, password/email changed, logged out)."""
+    for token_key in _user_token_keys.pop(str(user_id), ()):
+        _verified_user_cache.pop(token_key)
+
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -15,14 +73,23 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     
     try:
         token = credentials.credentials
+        token_key = _token_key(token)
+        cached_user = _verified_user_cache.get(token_key)
+        if cached_user is not None:
+            return cached_user
+
         supabase = get_supabase()
         
-        # Verify the JWT token with Supabase
-        user_response = supabase.auth.get_user(token)
+        # Verify the JWT token with Supabase; the SDK call is blocking, so keep it off the event loop
+        user_response = await asyncio.to_thread(supabase.auth.get_user, token)
         
         if not user_response or not user_response.user:
             raise credentials_exception
-            
+
+        # Tokens already at or past exp are never cached
+        ttl_seconds = _token_cache_ttl(token)
+        if ttl_seconds > 0:
+            _cache_verified_user(token_key, user_response.user, ttl_seconds)
         return user_response.user
         
     except Exception as e:
@@ -43,7 +110,8 @@ async def get_current_admin(user = Depends(get_current_user)):
     verifies that the current user has the 'admin' role.
     """
     try:
-        profile = await supabase_crud.get_profile(user.id)
+        # Read the role fresh: a cached profile could keep a demoted or deleted admin in
+        profile = await supabase_crud.get_profile(user.id, use_cache=False)
         if not profile:
              raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
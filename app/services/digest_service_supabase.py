@@ -1,32 +1,43 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 import requests
 from collections import defaultdict
 from app.crud.supabase_crud import SupabaseCRUD
 
-async def create_and_send_digest_supabase(crud: SupabaseCRUD, brand_id: int) -> Dict:
+async def create_and_send_digest_supabase(
+    crud: SupabaseCRUD,
+    brand_id: int,
+    brand: Optional[Dict[str, Any]] = None,
+    webhook_config: Optional[Dict[str, Any]] = None,
+    unsent_mentions: Optional[List[Dict[str, Any]]] = None,
+) -> Dict:
     """
     Creates and sends a digest of new mentions for a brand to its webhook using Supabase
     
     Args:
         crud: Supabase CRUD instance
         brand_id: ID of the brand to send digest for
+        brand, webhook_config, unsent_mentions: Optional prefetched rows, so
+            callers digesting many brands can load them in batches
         
     Returns:
         Dict with result information
     """
     
     # Get brand to verify it exists and get profile_id
-    brand = await crud.get_brand(brand_id)
+    if brand is None:
+        brand = await crud.get_brand(brand_id)
     if not brand:
         raise ValueError(f"Brand with ID {brand_id} not found")
     
     # Get webhook URL from integration_configs
-    webhook_config = await crud.get_webhook_config_by_profile(brand["profile_id"])
+    if webhook_config is None:
+        webhook_config = await crud.get_webhook_config_by_profile(brand["profile_id"])
     if not webhook_config or not webhook_config.get("webhook_url"):
         raise ValueError(f"No webhook configuration found for brand {brand_id}")
     
     # Get all unsent mentions for this brand
-    unsent_mentions = await crud.get_unsent_mentions_by_brand(brand_id)
+    if unsent_mentions is None:
+        unsent_mentions = await crud.get_unsent_mentions_by_brand(brand_id)
     
     if not unsent_mentions:
         return {
@@ -118,13 +129,13 @@ async def create_and_send_digest_supabase(crud: SupabaseCRUD, brand_id: int) ->
         if response.status_code == 200:
             # Mark mentions as sent
             mention_ids = [mention["id"] for mention in unsent_mentions]
-            await crud.mark_mentions_as_sent(mention_ids)
+            mentions_updated = await crud.mark_mentions_as_sent(mention_ids)
             
             return {
                 "success": True,
                 "message": f"Digest sent successfully for {brand['name']}",
                 "mentions_sent": total_mentions,
-                "mentions_updated": len(mention_ids),
+                "mentions_updated": mentions_updated,
                 "webhook_url": webhook_config["webhook_url"]
             }
         else:
@@ -9,7 +9,9 @@ import httpx
 import logging
 import asyncio
 from typing import List, Dict, Optional, Tuple
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from app.core.config import settings
+from app.services.scraping.core.http_client import is_retryable_error, get_shared_async_client
 
 logger = logging.getLogger("scraping.relevance_filter")
 
@@ -19,7 +21,8 @@ class RelevanceFilter:
     Evaluates article relevance using DeepSeek V3 API.
 
     Features:
-    - Parallel execution for high performance
+    - Parallel execution, bounded by DEEPSEEK_MAX_CONCURRENCY
+    - Retries with backoff on rate limiting (429), 5xx and network errors
     - Fail-open design: Defaults to True on API failure to prevent data loss
     - Cost-optimized prompting
     """
@@ -31,6 +34,23 @@ class RelevanceFilter:
         self.api_key = settings.deepseek_api_key.get_secret_value()
         self.model = settings.deepseek_model
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(min=1, max=8),
+        retry=retry_if_exception(is_retryable_error),
+        reraise=True
+    )
+    async def _post_completion(self, client: httpx.AsyncClient, headers: Dict[str, str], payload: Dict) -> Dict:
+        """POST one chat completion, backing off and retrying when the API is throttling or flaky."""
+        response = await client.post(
+            self.API_URL,
+            headers=headers,
+            json=payload,
+            timeout=self.TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return response.json()
+
     async def _check_single_relevance(self, client: httpx.AsyncClient, text: str, context: str, index: int) -> Tuple[int, bool]:
         """
         Helper method to check a single mention's relevance.
@@ -69,14 +89,7 @@ class RelevanceFilter:
         }
 
         try:
-            response = await client.post(
-                self.API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-
-            result = response.json()
+            result = await self._post_completion(client, headers, payload)
             answer = result["choices"][0]["message"]["content"].strip().upper()
             
             # Check for YES (handling potential punctuation like "YES.")
@@ -127,19 +140,26 @@ class RelevanceFilter:
 
         logger.info(f"🤖 Starting parallel AI relevance check for {len(mentions)} mentions...")
 
-        # Create a single client for all requests (more efficient connection pooling)
-        async with httpx.AsyncClient(timeout=self.TIMEOUT_SECONDS) as client:
-            tasks = []
-            for i, mention in enumerate(mentions):
-                # Build text from title and content teaser
-                title = mention.get("title", "")
-                content = mention.get("content_teaser", "")
-                text = f"{title}. {content}".strip()
+        # Reuse the shared pooled client so connections to the API stay warm across runs
+        client = get_shared_async_client()
+        # Bounded so a large scrape does not fire hundreds of requests at once and get throttled
+        semaphore = asyncio.Semaphore(max(1, settings.deepseek_max_concurrency))
+
+        async def _check(text: str, index: int) -> Tuple[int, bool]:
+            async with semaphore:
+                return await self._check_single_relevance(client, text, context, index)
+
+        tasks = []
+        for i, mention in enumerate(mentions):
+            # Build text from title and content teaser
+            title = mention.get("title", "")
+            content = mention.get("content_teaser", "")
+            text = f"{title}. {content}".strip()
                 
-                tasks.append(self._check_single_relevance(client, text, context, i))
+            tasks.append(_check(text, i))
 
-            # Run all tasks in parallel
-            results = await asyncio.gather(*tasks)
+        # Run all tasks in parallel
+        results = await asyncio.gather(*tasks)
 
         # Process results
         # results is a list of tuples (index, is_relevant)
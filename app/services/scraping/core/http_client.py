@@ -1,5 +1,7 @@
+import asyncio
 import httpx
 from time import perf_counter
+from typing import Optional
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -16,6 +18,8 @@ TIMEOUT_SECONDS = 6
 MAX_RETRIES = 2
 RETRY_WAIT_MIN = 2  # seconds
 RETRY_WAIT_MAX = 8  # seconds
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE = 50
 
 # Initialize User-Agent rotator
 ua = UserAgent()
@@ -53,7 +57,42 @@ def get_default_headers() -> dict:
     return headers
 
 
-def _is_retryable_error(exception: Exception) -> bool:
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled AsyncClient for the running event loop.
+
+    Providers share this client across a scrape run so keep-alive connections
+    are reused between queries, providers and brands. Callers must not close it;
+    use close_shared_async_client() on shutdown. A new client is created if the
+    previous one was closed or belongs to another event loop.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            timeout=TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+                max_connections=POOL_MAX_CONNECTIONS,
+            ),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_async_client() -> None:
+    """Close the shared AsyncClient, if one was created."""
+    global _shared_client, _shared_client_loop
+    client, _shared_client, _shared_client_loop = _shared_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def is_retryable_error(exception: Exception) -> bool:
     """
     Retry ONLY on:
     - httpx.RequestError (network/transport issues), excluding timeouts
@@ -84,7 +123,7 @@ def _is_retryable_error(exception: Exception) -> bool:
 @retry(
     stop=stop_after_attempt(MAX_RETRIES),
     wait=wait_exponential(min=RETRY_WAIT_MIN, max=RETRY_WAIT_MAX),
-    retry=retry_if_exception(_is_retryable_error),
+    retry=retry_if_exception(is_retryable_error),
     reraise=True
 )
 async def fetch_with_retry(
@@ -1,6 +1,14 @@
 import os
 from typing import Tuple
 
+from app.core.config import settings
+
+# prometheus_client picks its multiprocess value storage from the process
+# environment when first imported, so a directory configured only in .env is
+# exported here, ahead of that import.
+if settings.prometheus_multiproc_dir.strip():
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.prometheus_multiproc_dir.strip())
+
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     REGISTRY,
@@ -188,10 +196,10 @@ def render_metrics() -> Tuple[bytes, str]:
     Render Prometheus metrics.
     Supports multiprocess mode when PROMETHEUS_MULTIPROC_DIR is configured.
     """
-    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR", "").strip()
+    multiproc_dir = settings.prometheus_multiproc_dir.strip()
     if multiproc_dir and multiprocess is not None:
         registry = CollectorRegistry()
-        multiprocess.MultiProcessCollector(registry)
+        multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
         return generate_latest(registry), CONTENT_TYPE_LATEST
 
     return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
 from typing import List
 
@@ -34,12 +35,16 @@ def _normalize_quotes(text: str) -> str:
     )
 
 
+@lru_cache(maxsize=4096)
 def sanitize_search_input(text: str) -> str:
     """
     Sanitize user/topic keyword text for provider queries.
 
     Removes quote characters anywhere in the string to avoid malformed
     provider query syntax like: Iran" Krig.
+
+    Pure and called repeatedly with the same keyword/topic names, so results
+    are memoized.
     """
     if not text:
         return ""
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import uuid
 from time import perf_counter
-from typing import Any, Awaitable, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta, timezone
 
 from app.services.scraping.providers.gnews import scrape_gnews
@@ -420,6 +420,7 @@ async def fetch_and_filter_mentions(
     allowed_languages: Optional[List[str]] = None,
     artifact_label: Optional[str] = None,
     brand_context: Optional[str] = None,
+    existing_links_lookup: Optional[Callable[[List[str]], Awaitable[Set[str]]]] = None,
 ) -> List[Dict]:
     """
     Fetch mentions from all sources and optionally filter by AI relevance.
@@ -431,6 +432,8 @@ async def fetch_and_filter_mentions(
         apply_relevance_filter: Whether to run AI relevance filter (default: True)
         lookback_days: Number of days to look back for mentions (default: 1). Ignored if from_date is set.
         from_date: Explicit datetime cutoff. If set, lookback_days is ignored.
+        existing_links_lookup: Optional async callable returning which links are already saved;
+                               those mentions are dropped before the AI relevance filter.
 
     Returns:
         List of relevant mentions (deduplicated)
@@ -452,6 +455,18 @@ async def fetch_and_filter_mentions(
     if not mentions:
         return []
 
+    # Already-saved links would only be ignored on insert; drop them before paying for model inference
+    if existing_links_lookup is not None:
+        existing_links = await existing_links_lookup([mention["link"] for mention in mentions])
+        if existing_links:
+            before_count = len(mentions)
+            mentions = [mention for mention in mentions if mention["link"] not in existing_links]
+            existing_removed = before_count - len(mentions)
+            observe_duplicates_removed(stage="existing_link", count=existing_removed)
+            _run_log(scrape_run_id, f"Skipped {existing_removed} mentions whose links are already saved")
+            if not mentions:
+                return []
+
     write_mentions_snapshot(
         scrape_run_id,
         "05_before_ai_filter",
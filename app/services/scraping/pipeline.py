@@ -1,13 +1,15 @@
+import asyncio
 import logging
 import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from time import perf_counter
-from typing import Dict, List, Optional, Tuple
+from time import perf_counter, struct_time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.crud.supabase_crud import SupabaseCRUD
+from app.crud.supabase_crud import MENTION_UPSERT_CHUNK_SIZE, MENTION_UPSERT_CONCURRENCY, SupabaseCRUD
 from app.services.scraping.core.date_utils import parse_mention_date
 from app.services.scraping.core.deduplication import filter_mentions_against_historical
 from app.services.scraping.core.metrics import observe_duplicates_removed, observe_scrape_run
@@ -16,6 +18,14 @@ from app.services.scraping.orchestrator import fetch_and_filter_mentions
 
 scraping_logger = logging.getLogger("scraping")
 
+# Back-to-back runs for the same brand (e.g. cron + manual trigger) reuse the
+# fetched mentions instead of repeating all provider I/O. Saving them again is
+# harmless because mention inserts ignore (post_link, topic_id) duplicates.
+_fetch_result_cache = TTLCache(maxsize=128, ttl_seconds=settings.scraping_fetch_cache_ttl_seconds)
+
+# Compiled matchers keyed by each topic's (keyword id, text) pairs, so repeat
+# runs over an unchanged keyword set skip regex compilation entirely.
+_matcher_cache = TTLCache(maxsize=256, ttl_seconds=3600)
 
 
 @dataclass
@@ -47,46 +57,116 @@ def build_search_query(topic: Dict, keyword_text: str, brand_name: str) -> str:
     return sanitize_search_input(topic.get("name", ""))
 
 
-def _build_keyword_boundary_pattern(keyword_text: str) -> Tuple[Optional[re.Pattern], str]:
-    cleaned = sanitize_search_input(keyword_text)
-    if not cleaned:
-        return None, ""
+_WORD_BOUNDARY_TEMPLATE = r"(?<!\w){}(?!\w)"
+
+
+def _keyword_phrase(keyword_text: str) -> Tuple[str, str]:
+    """Return (phrase regex without boundaries, normalized keyword) or ("", "") for empty keywords."""
+    normalized = sanitize_search_input(keyword_text).lower()
+    if not normalized:
+        return "", ""
 
-    tokens = [re.escape(token) for token in cleaned.split() if token]
+    tokens = [re.escape(token) for token in normalized.split() if token]
     if not tokens:
-        return None, ""
+        return "", ""
+
+    return r"[\s\W_]+".join(tokens), normalized
+
 
-    phrase = r"[\s\W_]+".join(tokens)
-    return re.compile(rf"(?<!\w){phrase}(?!\w)", re.IGNORECASE), cleaned.lower()
+@dataclass(frozen=True)
+class CompiledKeywords:
+    """A topic's keywords compiled for matching."""
 
+    keywords: List[Tuple[Dict, re.Pattern]]
+    # Alternation of every keyword phrase; a miss here means no keyword can
+    # match, so most non-matching mentions cost one scan per field.
+    any_keyword: Optional[re.Pattern] = None
 
-def score_topic_match(topic_keywords: List[Dict], title: str, teaser: str) -> Tuple[int, List[Dict]]:
+
+def compile_topic_keywords(topic_keywords: List[Dict]) -> CompiledKeywords:
+    """
+    Compile a topic's keywords into (keyword, boundary pattern) pairs, skipping empty ones.
+
+    Patterns are compiled from the lowercased keyword without IGNORECASE, so
+    they must be searched against text that has already been lowercased.
+    Keywords are ordered longest text first (stable), so the first match
+    score_topic_match returns is the mention's primary keyword.
+    """
+    compiled: List[Tuple[Dict, re.Pattern]] = []
+    phrases: List[str] = []
+    for keyword in sorted(topic_keywords, key=lambda kw: len(kw.get("text", "")), reverse=True):
+        phrase, _ = _keyword_phrase(keyword.get("text", ""))
+        if phrase:
+            compiled.append((keyword, re.compile(_WORD_BOUNDARY_TEMPLATE.format(phrase))))
+            phrases.append(phrase)
+
+    any_keyword = None
+    if len(phrases) > 1:
+        any_keyword = re.compile(_WORD_BOUNDARY_TEMPLATE.format("(?:" + "|".join(phrases) + ")"))
+    return CompiledKeywords(keywords=compiled, any_keyword=any_keyword)
+
+
+def _compile_alternation(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """Combine boundary patterns into one that matches wherever any of them does."""
+    sources = list(dict.fromkeys(pattern.pattern for pattern in patterns))
+    if not sources:
+        return None
+    return re.compile("|".join(sources))
+
+
+def build_match_haystack(title: str, teaser: str) -> str:
+    """Join lowercased title and teaser into one buffer for fast no-match checks."""
+    return f"{title}\x00{teaser}"
+
+
+def score_topic_match(
+    compiled_keywords: CompiledKeywords,
+    title: str,
+    teaser: str,
+    haystack: Optional[str] = None,
+    field_hits: Optional[Dict[str, Tuple[bool, bool]]] = None,
+    min_score: int = 0,
+) -> Tuple[int, List[Dict]]:
     """
-    Score a mention against a topic's keywords.
+    Score a mention against a topic's compiled keywords.
+
+    title and teaser must already be lowercased (patterns are case-sensitive).
+    haystack is build_match_haystack(title, teaser); pass it in when scoring
+    several topics for the same mention. field_hits, if given, memoizes
+    (in_title, in_teaser) per pattern for this mention, so keywords shared by
+    several topics are only searched once. If min_score is set, scoring stops
+    as soon as the remaining keywords can no longer reach it, and the partial
+    (losing) result is returned.
 
     Score = number of distinct keywords found anywhere in title or teaser.
     Each keyword counts once regardless of where it appears or how long it is.
     matched_in is tracked per match for audit purposes only.
     """
-    matches = []
-
-    for keyword in topic_keywords:
-        keyword_text = keyword.get("text", "")
-        if not keyword_text:
-            continue
+    if haystack is None:
+        haystack = build_match_haystack(title, teaser)
 
-        if "_compiled_pattern" not in keyword:
-            cached_pattern, normalized_keyword = _build_keyword_boundary_pattern(keyword_text)
-            keyword["_compiled_pattern"] = cached_pattern
-            keyword["_normalized_keyword"] = normalized_keyword
-        else:
-            cached_pattern = keyword.get("_compiled_pattern")
-
-        if cached_pattern is None:
-            continue
+    # A phrase may match across the title/teaser seam in the haystack, so a hit
+    # there is only a candidate; a miss rules the keyword out for both fields.
+    any_keyword = compiled_keywords.any_keyword
+    if any_keyword is not None and not any_keyword.search(haystack):
+        return 0, []
 
-        in_title = bool(cached_pattern.search(title))
-        in_teaser = bool(cached_pattern.search(teaser))
+    matches = []
+    remaining = len(compiled_keywords.keywords)
+
+    for keyword, pattern in compiled_keywords.keywords:
+        if len(matches) + remaining < min_score:
+            break
+        remaining -= 1
+        hits = field_hits.get(pattern.pattern) if field_hits is not None else None
+        if hits is None:
+            if pattern.search(haystack):
+                hits = (bool(pattern.search(title)), bool(pattern.search(teaser)))
+            else:
+                hits = (False, False)
+            if field_hits is not None:
+                field_hits[pattern.pattern] = hits
+        in_title, in_teaser = hits
         if not (in_title or in_teaser):
             continue
 
@@ -106,6 +186,25 @@ def _normalize_last_scraped_at(last_scraped_at: object) -> Optional[datetime]:
     return parse_mention_date(last_scraped_at)
 
 
+def _extract_published_iso(mention: Dict) -> Optional[str]:
+    """
+    published_at for the mention row, as an ISO-8601 UTC string.
+
+    Providers hand over published_parsed as a UTC struct_time, which goes
+    straight into an aware datetime (skipping parse_mention_date's type
+    dispatch); datetime() also rejects impossible feed dates such as Feb 30,
+    which then take the regular path like any other unusable value.
+    """
+    published_parsed = mention.get("published_parsed")
+    if isinstance(published_parsed, struct_time):
+        try:
+            return datetime(*published_parsed[:6], tzinfo=timezone.utc).isoformat()
+        except (ValueError, OverflowError):
+            pass
+    published_date = _extract_published_datetime(mention)
+    return published_date.isoformat() if published_date else None
+
+
 def _extract_published_datetime(mention: Dict) -> Optional[datetime]:
     published_parsed = mention.get("published_parsed")
     if published_parsed:
@@ -118,20 +217,334 @@ def _extract_published_datetime(mention: Dict) -> Optional[datetime]:
     return None
 
 
+async def _fetch_mentions_cached(
+    brand_id: int,
+    query_list: List[str],
+    *,
+    apply_relevance_filter: bool,
+    from_date: datetime,
+    scrape_run_id: Optional[str],
+    allowed_languages: List[str],
+    artifact_label: str,
+    brand_context: str,
+    existing_links_lookup: Optional[Callable[[List[str]], Awaitable[set[str]]]] = None,
+) -> List[Dict]:
+    """
+    fetch_and_filter_mentions with a short per-(brand, keyword set) result cache.
+
+    Keyword edits change the key, so they never see stale results. A cached
+    result is only reused if it was fetched from an earlier (wider) from_date.
+    """
+    use_cache = settings.scraping_fetch_cache_ttl_seconds > 0
+    cache_key = (
+        brand_id,
+        tuple(sorted(query_list)),
+        tuple(allowed_languages),
+        brand_context,
+        apply_relevance_filter,
+    )
+    if use_cache:
+        cached = _fetch_result_cache.get(cache_key)
+        if cached is not None and cached[0] <= from_date:
+            _log(scrape_run_id, f"Reusing {len(cached[1])} recently fetched mentions for '{artifact_label}'")
+            return list(cached[1])
+
+    mentions = await fetch_and_filter_mentions(
+        query_list,
+        apply_relevance_filter=apply_relevance_filter,
+        from_date=from_date,
+        scrape_run_id=scrape_run_id,
+        allowed_languages=allowed_languages,
+        artifact_label=artifact_label,
+        brand_context=brand_context,
+        existing_links_lookup=existing_links_lookup,
+    )
+    if use_cache:
+        _fetch_result_cache.set(cache_key, (from_date, list(mentions)))
+    return mentions
+
+
+TopicResolver = Callable[[Dict], Optional[Tuple[Dict, List[Dict]]]]
+
+
+@dataclass
+class MentionSaveResult:
+    mentions_saved: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def build_keyword_topic_resolver(
+    active_topics: List[Dict],
+    topic_keywords_cache: Dict[int, List[Dict]],
+) -> TopicResolver:
+    """
+    Build a resolver that assigns a mention to its best-matching topic.
+
+    Returns (topic, keyword_matches), or None when no topic reaches
+    settings.scraping_min_keyword_matches. Keyword patterns are compiled once
+    per keyword set (and reused across runs) so the per-mention loop only
+    runs searches.
+    """
+    topic_keywords = [topic_keywords_cache.get(topic["id"], []) for topic in active_topics]
+    matcher_key = tuple(
+        tuple((keyword.get("id"), keyword.get("text", "")) for keyword in keywords)
+        for keywords in topic_keywords
+    )
+    matcher = _matcher_cache.get(matcher_key)
+    if matcher is None:
+        compiled_per_topic = [compile_topic_keywords(keywords) for keywords in topic_keywords]
+        # One pass over the mention decides whether any topic can match at all;
+        # most scraped mentions stop here without per-topic scoring.
+        any_topic_keyword = _compile_alternation(
+            [pattern for compiled in compiled_per_topic for _, pattern in compiled.keywords]
+        )
+        matcher = (compiled_per_topic, any_topic_keyword)
+        _matcher_cache.set(matcher_key, matcher)
+    compiled_per_topic, any_topic_keyword = matcher
+    compiled_topics = list(zip(active_topics, compiled_per_topic))
+
+    min_matches = max(1, settings.scraping_min_keyword_matches)
+    # A topic's score is bounded by its keyword count. Scoring the topics with
+    # the most keywords first lets the rest be skipped (or cut short) once they
+    # can no longer beat the current best. Ties still go to the topic that
+    # comes first in active_topics, via its original index.
+    ranked_topics = sorted(
+        ((index, topic, compiled) for index, (topic, compiled) in enumerate(compiled_topics)),
+        key=lambda item: len(item[2].keywords),
+        reverse=True,
+    )
+
+    def resolve(mention: Dict) -> Optional[Tuple[Dict, List[Dict]]]:
+        best_index = None
+        best_topic = None
+        best_topic_score = 0
+        best_topic_matches: List[Dict] = []
+        # Lowercased once per mention; keyword patterns are pre-lowercased.
+        get = mention.get
+        title = (get("title") or "").lower()
+        teaser = (get("content_teaser") or "").lower()
+        haystack = build_match_haystack(title, teaser)
+        if any_topic_keyword is None or not any_topic_keyword.search(haystack):
+            return None
+
+        field_hits: Dict[str, Tuple[bool, bool]] = {}
+        for index, topic, compiled_keywords in ranked_topics:
+            upper_bound = len(compiled_keywords.keywords)
+            if upper_bound < best_topic_score:
+                break  # Topics are ranked by upper bound; none of the rest can win.
+
+            needed = best_topic_score if best_index is not None and index < best_index else best_topic_score + 1
+            needed = max(needed, min_matches)
+            if upper_bound < needed:
+                continue
+
+            topic_score, topic_matches = score_topic_match(
+                compiled_keywords, title, teaser, haystack, field_hits, min_score=needed
+            )
+            if topic_score >= needed:
+                best_index = index
+                best_topic_score = topic_score
+                best_topic = topic
+                best_topic_matches = topic_matches
+
+        if best_topic is None:
+            return None
+        return best_topic, best_topic_matches
+
+    return resolve
+
+
+def _resolve_mentions(
+    resolve_topic: TopicResolver,
+    mentions: List[Dict],
+) -> List[Tuple[Optional[Tuple[Dict, List[Dict]]], Optional[Exception]]]:
+    """Resolve topics for a batch of mentions, capturing per-mention errors."""
+    resolutions = []
+    for mention in mentions:
+        try:
+            resolutions.append((resolve_topic(mention), None))
+        except Exception as exc:
+            resolutions.append((None, exc))
+    return resolutions
+
+
+async def save_mentions(
+    crud: SupabaseCRUD,
+    mentions: List[Dict],
+    brand_id: int,
+    resolve_topic: TopicResolver,
+    scrape_run_id: Optional[str] = None,
+    after_mentions_saved: Optional[Callable[[], Awaitable[Any]]] = None,
+) -> MentionSaveResult:
+    """
+    Persist scraped mentions for a brand.
+
+    Resolves platforms, assigns each mention a topic via `resolve_topic`
+    (mentions resolving to None are dropped), batch-inserts the mentions and
+    records their keyword matches. `after_mentions_saved`, if given, is
+    awaited once the mention rows are stored, concurrently with the
+    keyword-match write.
+    """
+    result = MentionSaveResult()
+    errors = result.errors
+
+    unique_platforms = {(m.get("platform") or "Unknown") for m in mentions}
+    platform_cache: Dict[str, Dict] = await crud.get_or_create_platforms(list(unique_platforms))
+    for platform_name in unique_platforms - platform_cache.keys():
+        _log(scrape_run_id, f"Failed to resolve platform '{platform_name}'", logging.ERROR)
+
+    # Prepared rows are flushed in upsert-sized chunks while the loop runs.
+    # Up to MENTION_UPSERT_CONCURRENCY chunks are inserted in the background;
+    # flush() waits for a free slot, which also bounds the rows held in memory.
+    pending_rows: List[Dict] = []
+    pending_matches: Dict[Tuple[str, int], List[Dict]] = {}
+    mention_keyword_rows: List[Dict] = []
+    # Rows already staged this run, by the mentions table's unique key; repeats
+    # would only be discarded by ON CONFLICT DO NOTHING after the round trip.
+    staged_keys: set[Tuple[str, int]] = set()
+    kept = 0
+    duplicates = 0
+    insert_slots = asyncio.Semaphore(MENTION_UPSERT_CONCURRENCY)
+    insert_tasks: List[asyncio.Task] = []
+
+    async def insert_chunk(rows: List[Dict], matches: Dict[Tuple[str, int], List[Dict]]) -> None:
+        try:
+            saved, batch_errors, inserted_rows = await crud.batch_create_mentions(rows)
+        finally:
+            insert_slots.release()
+        result.mentions_saved += saved
+        errors.extend(batch_errors)
+
+        # Matches are recorded for newly inserted mentions only; mentions that
+        # already existed got theirs when they were first saved.
+        for row in inserted_rows:
+            for match in matches.get((row["post_link"], row["topic_id"]), ()):
+                mention_keyword_rows.append(
+                    {
+                        "mention_id": row["id"],
+                        **match,
+                    }
+                )
+
+    async def flush() -> None:
+        if not pending_rows:
+            return
+        await insert_slots.acquire()
+        insert_tasks.append(asyncio.create_task(insert_chunk(pending_rows.copy(), pending_matches.copy())))
+        pending_rows.clear()
+        pending_matches.clear()
+
+    for batch_start in range(0, len(mentions), MENTION_UPSERT_CHUNK_SIZE):
+        batch = mentions[batch_start:batch_start + MENTION_UPSERT_CHUNK_SIZE]
+        # Keyword matching is CPU-bound pure Python; run it in a worker thread
+        # so the event loop keeps serving other requests during large scrapes.
+        resolutions = await asyncio.to_thread(_resolve_mentions, resolve_topic, batch)
+
+        for mention, (resolved, resolve_error) in zip(batch, resolutions):
+            get = mention.get  # Bound once; the loop body reads several keys per mention.
+            try:
+                platform = platform_cache.get(get("platform") or "Unknown")
+                if not platform:
+                    errors.append(f"Platform not found for mention: {get('title', 'Unknown')}")
+                    continue
+
+                if resolve_error is not None:
+                    raise resolve_error
+                if resolved is None:
+                    continue  # Drop mention — insufficient keyword matches, no fallback
+                best_topic, best_topic_matches = resolved
+
+                post_link = get("link", "")
+                mention_key = (post_link, best_topic["id"])
+                if mention_key in staged_keys:
+                    duplicates += 1
+                    continue
+                staged_keys.add(mention_key)
+
+                # Matches come longest keyword first, and every match scores 1.
+                primary_keyword_id = best_topic_matches[0]["keyword"].get("id") if best_topic_matches else None
+
+                # Dates are only parsed for mentions that are kept.
+                published_at = _extract_published_iso(mention)
+                mention_data = {
+                    "caption": get("title", ""),
+                    "post_link": post_link,
+                    "published_at": published_at,
+                    "content_teaser": get("content_teaser"),
+                    "platform_id": platform["id"],
+                    "brand_id": brand_id,
+                    "topic_id": best_topic["id"],
+                    "primary_keyword_id": primary_keyword_id,
+                    "read_status": False,
+                    "notified_status": False,
+                }
+                pending_rows.append(mention_data)
+                kept += 1
+
+                if best_topic_matches and post_link:
+                    pending_matches[mention_key] = [
+                        {
+                            "keyword_id": match["keyword"]["id"],
+                            "matched_in": match["matched_in"],
+                            "score": match["score"],
+                        }
+                        for match in best_topic_matches
+                    ]
+
+            except Exception as exc:
+                error_msg = f"Error preparing mention '{get('title', 'Unknown')}': {exc}"
+                errors.append(error_msg)
+                _log(scrape_run_id, error_msg, logging.ERROR)
+                continue
+
+            if len(pending_rows) >= MENTION_UPSERT_CHUNK_SIZE:
+                await flush()
+
+    await flush()
+    await asyncio.gather(*insert_tasks)
+
+    if duplicates:
+        _log(scrape_run_id, f"Skipped {duplicates} duplicate mentions (same link and topic)")
+    dropped = len(mentions) - kept - duplicates
+    if dropped:
+        _log(scrape_run_id, f"Dropped {dropped} mentions (fewer than {settings.scraping_min_keyword_matches} keyword matches)")
+
+    # The keyword-match write and the caller's follow-up are independent.
+    pending = []
+    if mention_keyword_rows:
+        pending.append(crud.batch_create_mention_keywords(mention_keyword_rows))
+    if after_mentions_saved is not None:
+        pending.append(after_mentions_saved())
+    outcomes = await asyncio.gather(*pending)
+    if mention_keyword_rows:
+        errors.extend(outcomes[0])
+
+    return result
+
+
 async def process_brand_scrape(
     brand_id: int,
     crud: SupabaseCRUD,
     scrape_run_id: Optional[str] = None,
     apply_relevance_filter: bool = True,
     acquire_lock: bool = True,
+    brand: Optional[Dict] = None,
+    topics: Optional[List[Dict]] = None,
 ) -> BrandScrapeResult:
+    """
+    Scrape one brand end to end and save its mentions.
+
+    brand and topics (with their "keywords") may be passed in when the caller
+    has already loaded them in bulk; otherwise they are fetched here.
+    """
     scrape_run_id = scrape_run_id or f"b{brand_id}-{uuid.uuid4().hex[:8]}"
     run_started_at = datetime.now(timezone.utc)
     run_started_perf = perf_counter()
     run_status = "error"
     lock_acquired = False
 
-    brand = await crud.get_brand(brand_id)
+    if brand is None:
+        brand = await crud.get_brand(brand_id)
     if not brand:
         run_status = "not_found"
         observe_scrape_run(scope="brand", status=run_status, duration_seconds=perf_counter() - run_started_perf)
@@ -160,7 +573,8 @@ async def process_brand_scrape(
                 )
 
         _log(scrape_run_id, f"Starting scrape for brand '{brand_name}' ({brand_id})")
-        topics = await crud.get_topics_by_brand(brand_id)
+        if topics is None:
+            topics = await crud.get_topics_by_brand(brand_id)
         active_topics = [topic for topic in topics if topic.get("is_active", True)]
 
         if not active_topics:
@@ -173,7 +587,7 @@ async def process_brand_scrape(
                 errors=["No active topics found for this brand"],
             )
 
-        search_queries = set()
+        search_queries: List[str] = []
         topic_keywords_cache: Dict[int, List[Dict]] = {}
         for topic in active_topics:
             topic_keywords = topic.get("keywords", []) or []
@@ -182,9 +596,10 @@ async def process_brand_scrape(
             for keyword in topic_keywords:
                 query = build_search_query(topic, keyword.get("text", ""), brand_name)
                 if query:
-                    search_queries.add(query)
+                    search_queries.append(query)
 
-        query_list = list(search_queries)
+        # Deduplicate once, keeping topic/keyword order so runs are reproducible.
+        query_list = list(dict.fromkeys(search_queries))
         if not query_list:
             run_status = "no_keywords"
             return BrandScrapeResult(
@@ -210,26 +625,39 @@ async def process_brand_scrape(
         brand_description = (brand.get("description") or "").strip()
         brand_context = f"{brand_name}: {brand_description}" if brand_description else brand_name
 
-        mentions = await fetch_and_filter_mentions(
-            query_list,
-            apply_relevance_filter=apply_relevance_filter,
-            from_date=from_date,
-            scrape_run_id=scrape_run_id,
-            allowed_languages=brand_languages,
-            artifact_label=brand_name,
-            brand_context=brand_context,
-        )
+        # The historical dedup baseline does not depend on what the providers
+        # return, so load it while they are fetching instead of afterwards.
+        recent_mentions_task = None
+        if settings.scraping_historical_dedup_enabled:
+            recent_mentions_task = asyncio.create_task(
+                crud.get_recent_mentions_for_brand(
+                    brand_id=brand_id,
+                    days_back=max(1, int(settings.scraping_historical_dedup_days)),
+                    limit=max(1, int(settings.scraping_historical_dedup_limit)),
+                )
+            )
 
-        if settings.scraping_historical_dedup_enabled and mentions:
-            historical_days = max(1, int(settings.scraping_historical_dedup_days))
-            historical_limit = max(1, int(settings.scraping_historical_dedup_limit))
-            recent_mentions = await crud.get_recent_mentions_for_brand(
-                brand_id=brand_id,
-                days_back=historical_days,
-                limit=historical_limit,
+        try:
+            mentions = await _fetch_mentions_cached(
+                brand_id,
+                query_list,
+                apply_relevance_filter=apply_relevance_filter,
+                from_date=from_date,
+                scrape_run_id=scrape_run_id,
+                allowed_languages=brand_languages,
+                artifact_label=brand_name,
+                brand_context=brand_context,
+                existing_links_lookup=lambda links: crud.get_existing_mention_links(brand_id, links),
             )
+        except BaseException:
+            if recent_mentions_task is not None:
+                recent_mentions_task.cancel()
+            raise
+
+        if recent_mentions_task is not None:
+            recent_mentions = await recent_mentions_task
 
-            if recent_mentions:
+            if recent_mentions and mentions:
                 mentions, historical_duplicates_removed = filter_mentions_against_historical(
                     mentions,
                     recent_mentions,
@@ -257,118 +685,18 @@ async def process_brand_scrape(
                 keywords_used=query_list,
             )
 
-        unique_platforms = {(m.get("platform") or "Unknown") for m in mentions}
-        platform_cache: Dict[str, Dict] = {}
-        for platform_name in unique_platforms:
-            platform = await crud.get_platform_by_name(platform_name)
-            if not platform:
-                platform = await crud.create_platform(platform_name)
-                if platform:
-                    _log(scrape_run_id, f"Created platform '{platform_name}' with ID {platform['id']}")
-                else:
-                    _log(scrape_run_id, f"Failed to create platform '{platform_name}'", logging.ERROR)
-
-            if platform:
-                platform_cache[platform_name] = platform
-
-        mentions_to_insert = []
-        mention_keyword_matches: Dict[Tuple[str, int], List[Dict]] = {}
-
-        for mention in mentions:
-            try:
-                published_date = _extract_published_datetime(mention)
-                platform_name = mention.get("platform") or "Unknown"
-                platform = platform_cache.get(platform_name)
-                if not platform:
-                    errors.append(f"Platform not found for mention: {mention.get('title', 'Unknown')}")
-                    continue
-
-                best_topic = None
-                best_topic_score = 0
-                best_topic_matches: List[Dict] = []
-                title = (mention.get("title") or "").lower()
-                teaser = (mention.get("content_teaser") or "").lower()
-
-                for topic in active_topics:
-                    topic_keywords = topic_keywords_cache.get(topic["id"], [])
-                    topic_score, topic_matches = score_topic_match(topic_keywords, title, teaser)
-                    if topic_score > best_topic_score:
-                        best_topic_score = topic_score
-                        best_topic = topic
-                        best_topic_matches = topic_matches
-
-                if best_topic_score < settings.scraping_min_keyword_matches:
-                    continue  # Drop mention — insufficient keyword matches, no fallback
-
-                primary_keyword_id = None
-                if best_topic_matches:
-                    best_match = sorted(
-                        best_topic_matches,
-                        key=lambda match: len(match["keyword"].get("text", "")),
-                        reverse=True,
-                    )[0]
-                    primary_keyword_id = best_match["keyword"].get("id")
-
-                mention_data = {
-                    "caption": mention.get("title", ""),
-                    "post_link": mention.get("link", ""),
-                    "published_at": published_date.isoformat() if published_date else None,
-                    "content_teaser": mention.get("content_teaser"),
-                    "platform_id": platform["id"],
-                    "brand_id": brand_id,
-                    "topic_id": best_topic["id"],
-                    "primary_keyword_id": primary_keyword_id,
-                    "read_status": False,
-                    "notified_status": False,
-                }
-                mentions_to_insert.append(mention_data)
-
-                if best_topic_matches and mention_data["post_link"]:
-                    mention_key = (mention_data["post_link"], mention_data["topic_id"])
-                    mention_keyword_matches[mention_key] = [
-                        {
-                            "keyword_id": match["keyword"]["id"],
-                            "matched_in": match["matched_in"],
-                            "score": match["score"],
-                        }
-                        for match in best_topic_matches
-                    ]
-
-            except Exception as exc:
-                error_msg = f"Error preparing mention '{mention.get('title', 'Unknown')}': {exc}"
-                errors.append(error_msg)
-                _log(scrape_run_id, error_msg, logging.ERROR)
-
-        dropped = len(mentions) - len(mentions_to_insert)
-        if dropped:
-            _log(scrape_run_id, f"Dropped {dropped} mentions (fewer than {settings.scraping_min_keyword_matches} keyword matches)")
-
-        mentions_saved = 0
-        if mentions_to_insert:
-            mentions_saved, batch_errors = await crud.batch_create_mentions(mentions_to_insert)
-            errors.extend(batch_errors)
-            _log(scrape_run_id, f"Batch saved {mentions_saved} mentions for '{brand_name}'")
-
-        if mention_keyword_matches:
-            mention_id_map = await crud.get_mentions_by_keys(brand_id, list(mention_keyword_matches.keys()))
-            mention_keyword_rows = []
-            for mention_key, matches in mention_keyword_matches.items():
-                mention_id = mention_id_map.get(mention_key)
-                if not mention_id:
-                    continue
-                for match in matches:
-                    mention_keyword_rows.append(
-                        {
-                            "mention_id": mention_id,
-                            **match,
-                        }
-                    )
-
-            if mention_keyword_rows:
-                match_errors = await crud.batch_create_mention_keywords(mention_keyword_rows)
-                errors.extend(match_errors)
+        save_result = await save_mentions(
+            crud,
+            mentions,
+            brand_id,
+            build_keyword_topic_resolver(active_topics, topic_keywords_cache),
+            scrape_run_id=scrape_run_id,
+            after_mentions_saved=lambda: crud.update_brand_last_scraped(brand_id, run_started_at),
+        )
+        errors.extend(save_result.errors)
+        if save_result.mentions_saved:
+            _log(scrape_run_id, f"Batch saved {save_result.mentions_saved} mentions for '{brand_name}'")
 
-        await crud.update_brand_last_scraped(brand_id, run_started_at)
         run_status = "success"
         return BrandScrapeResult(
             message=f"Scraping completed for brand '{brand_name}'",
@@ -377,7 +705,7 @@ async def process_brand_scrape(
             status=run_status,
             keywords_used=query_list,
             mentions_found=len(mentions),
-            mentions_saved=mentions_saved,
+            mentions_saved=save_result.mentions_saved,
             errors=errors,
         )
 
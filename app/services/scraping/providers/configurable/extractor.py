@@ -5,13 +5,17 @@ import re
 from datetime import datetime, timezone
 
 from bs4 import BeautifulSoup
+from cssselect import HTMLTranslator
 import dateparser
+from lxml import etree, html as lxml_html
 import trafilatura
 
 from app.core.selectors import (
     GENERIC_CONTENT_SELECTORS,
     GENERIC_DATE_SELECTORS,
     GENERIC_TITLE_SELECTORS,
+    compile_selector,
+    selector_subject_tag,
 )
 from app.services.scraping.core.date_utils import parse_mention_date
 from .config import _log
@@ -32,6 +36,35 @@ DATEPARSER_SETTINGS = {
     "PREFER_DATES_FROM": "past",
 }
 
+# The generic fallbacks run on every page without usable content, so they are
+# compiled once to XPath and evaluated on a plain lxml tree (libxml2 is about ten
+# times faster here than soupsieve on a BeautifulSoup tree). Each expression
+# carries the tag its match must have, so a page without that tag skips the
+# selector instead of walking the whole tree for a miss.
+_CSS_TO_XPATH = HTMLTranslator()
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def _tagged_xpaths(selectors: tuple) -> tuple:
+    # Only the first match (in document order, as select_one) is ever used, so
+    # each expression is wrapped in (...)[1]: libxml2 stops at the first hit and
+    # lxml builds one element proxy instead of one per match.
+    return tuple(
+        (selector_subject_tag(sel), etree.XPath(f"({_CSS_TO_XPATH.css_to_xpath(sel)})[1]"))
+        for sel in selectors
+    )
+
+
+GENERIC_TITLE_XPATHS = _tagged_xpaths(GENERIC_TITLE_SELECTORS)
+GENERIC_CONTENT_XPATHS = _tagged_xpaths(GENERIC_CONTENT_SELECTORS)
+GENERIC_DATE_XPATHS = _tagged_xpaths(GENERIC_DATE_SELECTORS)
+# Visible text of an element: script/style/template bodies and ruby annotations
+# are not article text (comments are never matched by text()).
+_ELEMENT_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]"
+)
+
 
 def _clean_text(text: str) -> str:
     return re.sub(r"\s+", " ", (text or "").strip())
@@ -44,19 +77,26 @@ def _extract_date_value(date_elem) -> tuple[str, bool]:
     return date_elem.get_text(strip=True), False
 
 
-def _extract_text_from_selector(soup: BeautifulSoup, selector: Optional[str]) -> str:
+def _select_one(soup: BeautifulSoup, selector):
+    """select_one for a CSS string (compiled once, then cached) or a precompiled pattern."""
+    if isinstance(selector, str):
+        selector = compile_selector(selector)
+    return selector.select_one(soup)
+
+
+def _extract_text_from_selector(soup: BeautifulSoup, selector) -> str:
     if not selector:
         return ""
-    elem = soup.select_one(selector)
+    elem = _select_one(soup, selector)
     if not elem:
         return ""
     return _clean_text(elem.get_text(" ", strip=True))
 
 
-def _extract_date_from_selector(soup: BeautifulSoup, selector: Optional[str]) -> tuple[str, bool]:
+def _extract_date_from_selector(soup: BeautifulSoup, selector) -> tuple[str, bool]:
     if not selector:
         return "", False
-    elem = soup.select_one(selector)
+    elem = _select_one(soup, selector)
     if not elem:
         return "", False
     date_value, confident = _extract_date_value(elem)
@@ -67,15 +107,74 @@ def _has_meaningful_content(content: str) -> bool:
     return len(_clean_text(content)) >= MIN_MEANINGFUL_CONTENT_CHARS
 
 
-def _extract_with_selector_list(soup: BeautifulSoup, selectors: list[str], extractor):
-    for selector in selectors:
-        value = extractor(soup, selector)
-        if isinstance(value, tuple):
-            if value[0]:
-                return value
-        elif value:
-            return value
-    return ("", False) if extractor == _extract_date_from_selector else ""
+def _element_text(elem, separator: str = "") -> str:
+    """Stripped, non-empty text nodes of elem joined with separator."""
+    return separator.join(text for text in (node.strip() for node in _ELEMENT_TEXT(elem)) if text)
+
+
+def _first_match(tree, xpath):
+    return next(iter(xpath(tree)), None)
+
+
+def _xpath_first_text(tree, xpaths: tuple, tag_names: set[str]) -> str:
+    for required_tag, xpath in xpaths:
+        if required_tag is not None and required_tag not in tag_names:
+            continue
+        elem = _first_match(tree, xpath)
+        if elem is not None:
+            text = _clean_text(_element_text(elem, " "))
+            if text:
+                return text
+    return ""
+
+
+def _xpath_first_date(tree, xpaths: tuple, tag_names: set[str]) -> tuple[str, bool]:
+    for required_tag, xpath in xpaths:
+        if required_tag is not None and required_tag not in tag_names:
+            continue
+        elem = _first_match(tree, xpath)
+        if elem is not None:
+            attribute_value = elem.get("datetime") or elem.get("content")
+            if attribute_value:
+                date_value, confident = attribute_value.strip(), True
+            else:
+                date_value, confident = _element_text(elem), False
+            date_value = _clean_text(date_value)
+            if date_value:
+                return date_value, confident
+    return "", False
+
+
+def _parse_html_tree(html_content: str):
+    try:
+        return lxml_html.document_fromstring(html_content)
+    except ValueError:
+        # lxml refuses str input that carries an encoding declaration (XHTML pages
+        # starting with <?xml ... encoding="..."?>). The text is already decoded,
+        # so hand it over as UTF-8 bytes and let the parser ignore the declaration.
+        return lxml_html.document_fromstring(html_content.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+
+
+def _extract_generic_sync(
+    html_content: str,
+    want_title: bool,
+    want_date: bool,
+) -> tuple[str, str, str, bool]:
+    """
+    Run the generic title/content/date fallbacks on an lxml parse of the page.
+
+    Each value is the first non-empty one in selector list order. An empty
+    document yields empty values.
+    """
+    try:
+        tree = _parse_html_tree(html_content)
+    except etree.ParserError:
+        return "", "", "", False
+    tag_names = {elem.tag for elem in tree.iter() if isinstance(elem.tag, str)}
+    title = _xpath_first_text(tree, GENERIC_TITLE_XPATHS, tag_names) if want_title else ""
+    content = _xpath_first_text(tree, GENERIC_CONTENT_XPATHS, tag_names)
+    date_str, date_confident = _xpath_first_date(tree, GENERIC_DATE_XPATHS, tag_names) if want_date else ("", False)
+    return title, content, date_str, date_confident
 
 
 def _extract_with_trafilatura_sync(html_content: str, scrape_run_id: Optional[str] = None) -> tuple[str, str, str]:
@@ -145,19 +244,18 @@ async def _extract_content(
             extracted_via = "config"
 
     if not _has_meaningful_content(content):
-        if not title:
-            title = _extract_with_selector_list(soup, GENERIC_TITLE_SELECTORS, _extract_text_from_selector)
+        generic_title, generic_content, generic_date, generic_date_confident = "", "", "", False
+        if html_content:
+            generic_title, generic_content, generic_date, generic_date_confident = await asyncio.to_thread(
+                _extract_generic_sync, html_content, not title, not date_str
+            )
 
-        generic_content = _extract_with_selector_list(soup, GENERIC_CONTENT_SELECTORS, _extract_text_from_selector)
+        if not title:
+            title = generic_title
         if len(generic_content) > len(content):
             content = generic_content
-
         if not date_str:
-            date_str, date_confident = _extract_with_selector_list(
-                soup,
-                GENERIC_DATE_SELECTORS,
-                _extract_date_from_selector,
-            )
+            date_str, date_confident = generic_date, generic_date_confident
 
         if _has_meaningful_content(content):
             extracted_via = "generic"
@@ -49,6 +49,11 @@ _playwright_semaphore = asyncio.Semaphore(PLAYWRIGHT_CONCURRENCY_LIMIT)
 _adaptive_storages: dict = {}
 
 
+async def _parse_html(html: str) -> BeautifulSoup:
+    """Parse a page in a worker thread; building the tree is the costliest CPU step per article."""
+    return await asyncio.to_thread(BeautifulSoup, html, "lxml")
+
+
 def _get_adaptive_storage_file() -> str:
     base_dir = Path(__file__).parents[5]  # trackanything-admin root
     storage_dir = base_dir / "adaptive_storage"
@@ -290,7 +295,7 @@ async def _scrape_article_content(
                         extracted_via = f"{extracted_via}+stealthy_session_adaptive"
                         observe_extraction("configurable", metrics_domain, "configurable_stealthy_session_success", len(content))
             if extraction_path != "stealthy_session_adaptive":
-                session_soup = BeautifulSoup(session_html, "lxml")
+                session_soup = await _parse_html(session_html)
                 title, content, date_str, date_confident, extracted_via = await _extract_content(
                     session_soup, session_html, config, scrape_run_id=scrape_run_id,
                 )
@@ -333,7 +338,7 @@ async def _scrape_article_content(
                         observe_extraction("configurable", metrics_domain, "configurable_adaptive_failure", 0)
                         _log(scrape_run_id, f"Adaptive extraction empty for {final_url}; falling through to BS4.", logging.DEBUG)
             if extraction_path != "scrapling_adaptive":
-                scrapling_soup = BeautifulSoup(scrapling_html, "lxml")
+                scrapling_soup = await _parse_html(scrapling_html)
                 title, content, date_str, date_confident, extracted_via = await _extract_content(
                     scrapling_soup,
                     scrapling_html,
@@ -382,7 +387,7 @@ async def _scrape_article_content(
         if final_url != normalize_url(url):
             _log(scrape_run_id, f"Redirected article URL: {url} -> {final_url}", level=logging.DEBUG)
 
-        soup = BeautifulSoup(response.text, "lxml")
+        soup = await _parse_html(response.text)
         title, content, date_str, date_confident, extracted_via = await _extract_content(
             soup,
             response.text,
@@ -401,7 +406,7 @@ async def _scrape_article_content(
         playwright_result = await _fetch_with_playwright(final_url, scrape_run_id=scrape_run_id)
         if playwright_result:
             pw_html, pw_final_url = playwright_result
-            pw_soup = BeautifulSoup(pw_html, "lxml")
+            pw_soup = await _parse_html(pw_html)
             pw_title, pw_content, pw_date_str, pw_date_confident, pw_extracted_via = await _extract_content(
                 pw_soup,
                 pw_html,
@@ -5,11 +5,9 @@ import asyncio
 import contextlib
 import logging
 
-import httpx
-
 from app.core.config import settings
 from app.crud.supabase_crud import SupabaseCRUD
-from app.services.scraping.core.http_client import TIMEOUT_SECONDS
+from app.services.scraping.core.http_client import get_shared_async_client
 from app.services.scraping.core.metrics import observe_extraction, observe_guardrail_event
 from .config import (
     BLIND_DOMAIN_CIRCUIT_BREAKER_THRESHOLD,
@@ -108,11 +106,8 @@ async def scrape_configurable_sources(
     domain_failure_lock = asyncio.Lock()
     blind_domain_lock = asyncio.Lock()
 
-    limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
     async with contextlib.AsyncExitStack() as stack:
-        client = await stack.enter_async_context(
-            httpx.AsyncClient(timeout=TIMEOUT_SECONDS, limits=limits)
-        )
+        client = get_shared_async_client()
         stealth_session = None
         if settings.scraping_stealthy_session_enabled:
             try:
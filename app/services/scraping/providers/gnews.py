@@ -7,7 +7,7 @@ import httpx
 
 from app.core.config import settings
 from app.services.scraping.core.date_utils import parse_mention_date
-from app.services.scraping.core.http_client import TIMEOUT_SECONDS, fetch_with_retry
+from app.services.scraping.core.http_client import fetch_with_retry, get_shared_async_client
 from app.services.scraping.core.text_processing import clean_keywords
 
 logger = logging.getLogger("scraping")
@@ -196,102 +196,102 @@ async def scrape_gnews(
     max_results = max(1, min(int(settings.gnews_max_results), 10))
 
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS) as client:
-            from app.services.scraping.core.http_client import get_default_headers
-            headers = get_default_headers()
-            entries = []
-            skipped_missing_date = 0
-            skipped_unparseable_date = 0
-            skipped_before_cutoff = 0
-            _log(scrape_run_id, f"Applying API cutoff from={_to_gnews_iso(since)}")
-
-            for keyword_idx, keyword in enumerate(keyword_queries, start=1):
-                if keyword_idx > 1 and settings.scraping_gnews_inter_request_delay_s > 0:
-                    await asyncio.sleep(settings.scraping_gnews_inter_request_delay_s)
-
-                query = _build_keyword_query(keyword)
-                if len(query) > GNEWS_QUERY_MAX_CHARS:
-                    _log(
-                        scrape_run_id,
-                        (
-                            f"Skipping query for keyword {keyword_idx}/{len(keyword_queries)} "
-                            f"(chars={len(query)} > {GNEWS_QUERY_MAX_CHARS})"
-                        ),
-                        logging.WARNING,
-                    )
-                    continue
-
+        client = get_shared_async_client()
+        from app.services.scraping.core.http_client import get_default_headers
+        headers = get_default_headers()
+        entries = []
+        skipped_missing_date = 0
+        skipped_unparseable_date = 0
+        skipped_before_cutoff = 0
+        _log(scrape_run_id, f"Applying API cutoff from={_to_gnews_iso(since)}")
+
+        for keyword_idx, keyword in enumerate(keyword_queries, start=1):
+            if keyword_idx > 1 and settings.scraping_gnews_inter_request_delay_s > 0:
+                await asyncio.sleep(settings.scraping_gnews_inter_request_delay_s)
+
+            query = _build_keyword_query(keyword)
+            if len(query) > GNEWS_QUERY_MAX_CHARS:
                 _log(
                     scrape_run_id,
                     (
-                        f"Keyword {keyword_idx}/{len(keyword_queries)} "
-                        f"single query (chars={len(query)}): {query[:220]}"
+                        f"Skipping query for keyword {keyword_idx}/{len(keyword_queries)} "
+                        f"(chars={len(query)} > {GNEWS_QUERY_MAX_CHARS})"
                     ),
-                    logging.DEBUG,
+                    logging.WARNING,
                 )
+                continue
 
-                params: Dict[str, str] = {
-                    "q": query,
-                    "token": settings.gnews_api_key.get_secret_value(),
-                    "max": str(max_results),
-                    "sortby": "publishedAt",
-                    "from": _to_gnews_iso(since),
-                }
-                response = await _fetch_gnews_with_attempts(
-                    client=client,
-                    headers=headers,
-                    attempts=_build_gnews_attempts(params, allowed_languages=allowed_languages),
-                    scrape_run_id=scrape_run_id,
-                    keyword_idx=keyword_idx,
-                    total_keywords=len(keyword_queries),
-                )
-                if response is None:
-                    continue
+            _log(
+                scrape_run_id,
+                (
+                    f"Keyword {keyword_idx}/{len(keyword_queries)} "
+                    f"single query (chars={len(query)}): {query[:220]}"
+                ),
+                logging.DEBUG,
+            )
+
+            params: Dict[str, str] = {
+                "q": query,
+                "token": settings.gnews_api_key.get_secret_value(),
+                "max": str(max_results),
+                "sortby": "publishedAt",
+                "from": _to_gnews_iso(since),
+            }
+            response = await _fetch_gnews_with_attempts(
+                client=client,
+                headers=headers,
+                attempts=_build_gnews_attempts(params, allowed_languages=allowed_languages),
+                scrape_run_id=scrape_run_id,
+                keyword_idx=keyword_idx,
+                total_keywords=len(keyword_queries),
+            )
+            if response is None:
+                continue
 
-                data = response.json()
-                articles_data = data.get("articles", [])
+            data = response.json()
+            articles_data = data.get("articles", [])
 
-                for article in articles_data:
-                    if "url" not in article:
+            for article in articles_data:
+                if "url" not in article:
+                    continue
+
+                try:
+                    published_at = article.get("publishedAt")
+                    if not published_at:
+                        skipped_missing_date += 1
+                        continue
+                    parsed = parse_mention_date(published_at)
+                    if parsed is None:
+                        skipped_unparseable_date += 1
                         continue
 
-                    try:
-                        published_at = article.get("publishedAt")
-                        if not published_at:
-                            skipped_missing_date += 1
-                            continue
-                        parsed = parse_mention_date(published_at)
-                        if parsed is None:
-                            skipped_unparseable_date += 1
-                            continue
-
-                        if parsed < since:
-                            skipped_before_cutoff += 1
-                            continue
-
-                        entries.append({
-                            "title": article.get("title", "Uden titel"),
-                            "link": article["url"],
-                            "published_parsed": parsed.timetuple(),
-                            "platform": "GNews",
-                            "content_teaser": article.get("description", ""),
-                        })
-                        _log(scrape_run_id, f"Match: {article.get('title', 'Uden titel')}", logging.DEBUG)
-
-                    except Exception as e:
-                        _log(scrape_run_id, f"Article parse error: {e}", logging.WARNING)
+                    if parsed < since:
+                        skipped_before_cutoff += 1
                         continue
 
-            _log(
-                scrape_run_id,
-                (
-                    f"Returning {len(entries)} valid mentions "
-                    f"(skipped_before_cutoff={skipped_before_cutoff}, "
-                    f"skipped_missing_date={skipped_missing_date}, "
-                    f"skipped_unparseable_date={skipped_unparseable_date})"
-                ),
-            )
-            return entries
+                    entries.append({
+                        "title": article.get("title", "Uden titel"),
+                        "link": article["url"],
+                        "published_parsed": parsed.timetuple(),
+                        "platform": "GNews",
+                        "content_teaser": article.get("description", ""),
+                    })
+                    _log(scrape_run_id, f"Match: {article.get('title', 'Uden titel')}", logging.DEBUG)
+
+                except Exception as e:
+                    _log(scrape_run_id, f"Article parse error: {e}", logging.WARNING)
+                    continue
+
+        _log(
+            scrape_run_id,
+            (
+                f"Returning {len(entries)} valid mentions "
+                f"(skipped_before_cutoff={skipped_before_cutoff}, "
+                f"skipped_missing_date={skipped_missing_date}, "
+                f"skipped_unparseable_date={skipped_unparseable_date})"
+            ),
+        )
+        return entries
 
     except Exception as e:
         _log(scrape_run_id, f"Request failed: {e}", logging.ERROR)
@@ -10,7 +10,7 @@ import httpx
 
 from app.services.scraping.core.date_utils import parse_mention_date
 from app.services.scraping.core.domain_utils import get_etld_plus_one
-from app.services.scraping.core.http_client import TIMEOUT_SECONDS, fetch_with_retry, get_default_headers
+from app.services.scraping.core.http_client import fetch_with_retry, get_default_headers, get_shared_async_client
 from app.services.scraping.core.metrics import observe_http_error
 from app.services.scraping.core.text_processing import (
     compile_keyword_patterns,
@@ -304,177 +304,177 @@ async def scrape_rss(
         f"Applying strict cutoff since={since.isoformat()} (explicit_from_date={explicit_cutoff is not None})",
     )
 
-    async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS) as client:
-        for keyword in keywords:
-            try:
-                keyword_patterns = compile_keyword_patterns([keyword])
-                if not keyword_patterns:
-                    _log(scrape_run_id, f"Keyword '{keyword}': no valid phrase pattern after cleaning", logging.WARNING)
-                    continue
-
-                keyword_entries_seen = 0
-                keyword_kept = 0
-                keyword_before_cutoff = 0
-                keyword_missing_date = 0
-                keyword_unparseable_date = 0
-                keyword_parse_errors = 0
-                keyword_phrase_miss = 0
-                keyword_duplicate_links = 0
-                keyword_seen_links: set[str] = set()
-
-                for locale_label, locale in locale_attempts:
-                    rss_url = _build_rss_url(keyword, locale)
-                    headers = get_default_headers()
-                    headers["Accept"] = RSS_ACCEPT_HEADER
-
-                    try:
-                        response = await fetch_with_retry(
-                            client,
-                            rss_url,
-                            rate_profile="rss",
-                            metrics_provider="rss",
-                            headers=headers,
-                        )
-                    except Exception as request_error:
-                        _log(
-                            scrape_run_id,
-                            (
-                                f"Keyword '{keyword}' locale={locale_label}: "
-                                f"fetch failed ({type(request_error).__name__}: {request_error})"
-                            ),
-                            logging.WARNING,
-                        )
-                        continue
-
-                    try:
-                        # feedparser is blocking and parse() accepts bytes payload.
-                        feed = await asyncio.to_thread(feedparser.parse, response.content)
-                    except Exception as parse_error:
-                        keyword_parse_errors += 1
-                        observe_http_error(
-                            provider="rss",
-                            domain=get_etld_plus_one(rss_url),
-                            error_type=f"feed_parse_{type(parse_error).__name__}",
-                        )
-                        _log(
-                            scrape_run_id,
-                            (
-                                f"Keyword '{keyword}' locale={locale_label}: "
-                                f"feed parse failed ({type(parse_error).__name__}: {parse_error})"
-                            ),
-                            logging.WARNING,
-                        )
-                        continue
+    client = get_shared_async_client()
+    for keyword in keywords:
+        try:
+            keyword_patterns = compile_keyword_patterns([keyword])
+            if not keyword_patterns:
+                _log(scrape_run_id, f"Keyword '{keyword}': no valid phrase pattern after cleaning", logging.WARNING)
+                continue
 
-                    if getattr(feed, "bozo", 0):
-                        bozo_exception = getattr(feed, "bozo_exception", None)
-                        observe_http_error(
-                            provider="rss",
-                            domain=get_etld_plus_one(rss_url),
-                            error_type="feed_bozo",
-                        )
-                        _log(
-                            scrape_run_id,
-                            (
-                                f"Keyword '{keyword}' locale={locale_label}: "
-                                f"feed parser bozo=1 ({bozo_exception})"
-                            ),
-                            logging.WARNING,
-                        )
+            keyword_entries_seen = 0
+            keyword_kept = 0
+            keyword_before_cutoff = 0
+            keyword_missing_date = 0
+            keyword_unparseable_date = 0
+            keyword_parse_errors = 0
+            keyword_phrase_miss = 0
+            keyword_duplicate_links = 0
+            keyword_seen_links: set[str] = set()
+
+            for locale_label, locale in locale_attempts:
+                rss_url = _build_rss_url(keyword, locale)
+                headers = get_default_headers()
+                headers["Accept"] = RSS_ACCEPT_HEADER
+
+                try:
+                    response = await fetch_with_retry(
+                        client,
+                        rss_url,
+                        rate_profile="rss",
+                        metrics_provider="rss",
+                        headers=headers,
+                    )
+                except Exception as request_error:
+                    _log(
+                        scrape_run_id,
+                        (
+                            f"Keyword '{keyword}' locale={locale_label}: "
+                            f"fetch failed ({type(request_error).__name__}: {request_error})"
+                        ),
+                        logging.WARNING,
+                    )
+                    continue
 
-                    entries = list(getattr(feed, "entries", []) or [])
-                    keyword_entries_seen += len(entries)
+                try:
+                    # feedparser is blocking and parse() accepts bytes payload.
+                    feed = await asyncio.to_thread(feedparser.parse, response.content)
+                except Exception as parse_error:
+                    keyword_parse_errors += 1
+                    observe_http_error(
+                        provider="rss",
+                        domain=get_etld_plus_one(rss_url),
+                        error_type=f"feed_parse_{type(parse_error).__name__}",
+                    )
                     _log(
                         scrape_run_id,
                         (
                             f"Keyword '{keyword}' locale={locale_label}: "
-                            f"status={response.status_code}, entries={len(entries)}"
+                            f"feed parse failed ({type(parse_error).__name__}: {parse_error})"
                         ),
-                        logging.DEBUG,
+                        logging.WARNING,
                     )
+                    continue
 
-                    for entry in entries:
-                        try:
-                            raw_date = (
-                                entry.get("published_parsed")
-                                or entry.get("updated_parsed")
-                                or entry.get("published")
-                            )
-                            if not raw_date:
-                                keyword_missing_date += 1
-                                continue
-                            published_dt = parse_mention_date(raw_date)
-                            if published_dt is None:
-                                keyword_unparseable_date += 1
-                                continue
-
-                            if published_dt < since:
-                                keyword_before_cutoff += 1
-                                continue
-
-                            title = entry.get("title", "Ingen titel")
-                            summary = entry.get("summary", "")
-                            text_to_match = f"{title}\n{summary}"
-                            if keyword_match_score(keyword_patterns, text_to_match) < 1:
-                                keyword_phrase_miss += 1
-                                continue
-
-                            canonical_link = await _extract_canonical_link(
-                                entry,
-                                client=client,
-                                canonical_cache=canonical_cache,
-                                scrape_run_id=scrape_run_id,
-                            )
-                            if not canonical_link:
-                                keyword_parse_errors += 1
-                                continue
-                            if canonical_link in keyword_seen_links:
-                                keyword_duplicate_links += 1
-                                continue
-                            keyword_seen_links.add(canonical_link)
-
-                            mentions.append({
-                                "title": title,
-                                "link": canonical_link,
-                                "content_teaser": summary[:200],
-                                "platform": "Google RSS",
-                                "published_parsed": published_dt.timetuple(),
-                            })
-                            keyword_kept += 1
-                            _log(scrape_run_id, f"Match: {title[:60]}", logging.DEBUG)
-
-                        except Exception as entry_error:
-                            keyword_parse_errors += 1
-                            _log(scrape_run_id, f"Entry parse error: {entry_error}", logging.WARNING)
-                            continue
+                if getattr(feed, "bozo", 0):
+                    bozo_exception = getattr(feed, "bozo_exception", None)
+                    observe_http_error(
+                        provider="rss",
+                        domain=get_etld_plus_one(rss_url),
+                        error_type="feed_bozo",
+                    )
+                    _log(
+                        scrape_run_id,
+                        (
+                            f"Keyword '{keyword}' locale={locale_label}: "
+                            f"feed parser bozo=1 ({bozo_exception})"
+                        ),
+                        logging.WARNING,
+                    )
 
-                total_entries_seen += keyword_entries_seen
-                total_kept += keyword_kept
-                total_before_cutoff += keyword_before_cutoff
-                total_missing_date += keyword_missing_date
-                total_unparseable_date += keyword_unparseable_date
-                total_parse_errors += keyword_parse_errors
-                total_phrase_miss += keyword_phrase_miss
-                total_duplicate_links += keyword_duplicate_links
+                entries = list(getattr(feed, "entries", []) or [])
+                keyword_entries_seen += len(entries)
                 _log(
                     scrape_run_id,
                     (
-                        f"Keyword '{keyword}' summary: entries={keyword_entries_seen}, "
-                        f"kept={keyword_kept}, before_cutoff={keyword_before_cutoff}, "
-                        f"missing_date={keyword_missing_date}, unparseable_date={keyword_unparseable_date}, "
-                        f"parse_errors={keyword_parse_errors}, phrase_miss={keyword_phrase_miss}, "
-                        f"duplicate_links={keyword_duplicate_links}"
+                        f"Keyword '{keyword}' locale={locale_label}: "
+                        f"status={response.status_code}, entries={len(entries)}"
                     ),
+                    logging.DEBUG,
                 )
 
-            except Exception as e:
-                observe_http_error(
-                    provider="rss",
-                    domain=get_etld_plus_one(GOOGLE_NEWS_RSS_SEARCH_URL),
-                    error_type=type(e).__name__,
-                )
-                _log(scrape_run_id, f"Error for '{keyword}': {e}", logging.WARNING)
-                continue
+                for entry in entries:
+                    try:
+                        raw_date = (
+                            entry.get("published_parsed")
+                            or entry.get("updated_parsed")
+                            or entry.get("published")
+                        )
+                        if not raw_date:
+                            keyword_missing_date += 1
+                            continue
+                        published_dt = parse_mention_date(raw_date)
+                        if published_dt is None:
+                            keyword_unparseable_date += 1
+                            continue
+
+                        if published_dt < since:
+                            keyword_before_cutoff += 1
+                            continue
+
+                        title = entry.get("title", "Ingen titel")
+                        summary = entry.get("summary", "")
+                        text_to_match = f"{title}\n{summary}"
+                        if keyword_match_score(keyword_patterns, text_to_match) < 1:
+                            keyword_phrase_miss += 1
+                            continue
+
+                        canonical_link = await _extract_canonical_link(
+                            entry,
+                            client=client,
+                            canonical_cache=canonical_cache,
+                            scrape_run_id=scrape_run_id,
+                        )
+                        if not canonical_link:
+                            keyword_parse_errors += 1
+                            continue
+                        if canonical_link in keyword_seen_links:
+                            keyword_duplicate_links += 1
+                            continue
+                        keyword_seen_links.add(canonical_link)
+
+                        mentions.append({
+                            "title": title,
+                            "link": canonical_link,
+                            "content_teaser": summary[:200],
+                            "platform": "Google RSS",
+                            "published_parsed": published_dt.timetuple(),
+                        })
+                        keyword_kept += 1
+                        _log(scrape_run_id, f"Match: {title[:60]}", logging.DEBUG)
+
+                    except Exception as entry_error:
+                        keyword_parse_errors += 1
+                        _log(scrape_run_id, f"Entry parse error: {entry_error}", logging.WARNING)
+                        continue
+
+            total_entries_seen += keyword_entries_seen
+            total_kept += keyword_kept
+            total_before_cutoff += keyword_before_cutoff
+            total_missing_date += keyword_missing_date
+            total_unparseable_date += keyword_unparseable_date
+            total_parse_errors += keyword_parse_errors
+            total_phrase_miss += keyword_phrase_miss
+            total_duplicate_links += keyword_duplicate_links
+            _log(
+                scrape_run_id,
+                (
+                    f"Keyword '{keyword}' summary: entries={keyword_entries_seen}, "
+                    f"kept={keyword_kept}, before_cutoff={keyword_before_cutoff}, "
+                    f"missing_date={keyword_missing_date}, unparseable_date={keyword_unparseable_date}, "
+                    f"parse_errors={keyword_parse_errors}, phrase_miss={keyword_phrase_miss}, "
+                    f"duplicate_links={keyword_duplicate_links}"
+                ),
+            )
+
+        except Exception as e:
+            observe_http_error(
+                provider="rss",
+                domain=get_etld_plus_one(GOOGLE_NEWS_RSS_SEARCH_URL),
+                error_type=type(e).__name__,
+            )
+            _log(scrape_run_id, f"Error for '{keyword}': {e}", logging.WARNING)
+            continue
 
     _log(
         scrape_run_id,
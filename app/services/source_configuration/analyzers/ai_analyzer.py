@@ -1,11 +1,10 @@
 import json
 import re
-import httpx
 from typing import Dict, Optional
 from bs4 import BeautifulSoup
 from openai import AsyncOpenAI
 from app.core.config import settings
-from app.core.selectors import GENERIC_SELECTORS_MAP
+from app.core.selectors import GENERIC_SELECTORS_MAP, compile_selector
 
 class AIAnalyzer:
     """
@@ -110,47 +109,46 @@ Return ONLY JSON: {\"is_valid\": true/false}"""
         test_url = pattern.replace('{keyword}', 'test')
 
         try:
-            from app.services.scraping.core.http_client import get_default_headers
-            async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
-                headers = get_default_headers()
-                response = await client.get(test_url, headers=headers)
-
-                if response.status_code == 200:
-                    # --- Check 1: Did it redirect to homepage? ---
-                    final_url = str(response.url).rstrip('/')
-                    homepage_url_https = f"https://{domain}".rstrip('/')
-                    homepage_url_http = f"http://{domain}".rstrip('/')
+            from app.services.scraping.core.http_client import get_default_headers, get_shared_async_client
+            headers = get_default_headers()
+            response = await get_shared_async_client().get(test_url, headers=headers, follow_redirects=True, timeout=10)
+
+            if response.status_code == 200:
+                # --- Check 1: Did it redirect to homepage? ---
+                final_url = str(response.url).rstrip('/')
+                homepage_url_https = f"https://{domain}".rstrip('/')
+                homepage_url_http = f"http://{domain}".rstrip('/')
                     
-                    if final_url == homepage_url_https or final_url == homepage_url_http:
-                        print(f"      ⚠️ Rejected: Redirected to homepage (Soft 404): {pattern}")
-                        return None
-
-                    # --- Check 2: Is content identical to homepage? (Soft 404 with same URL) ---
-                    if homepage_html:
-                        # Simple heuristic: Compare Page Titles
-                        try:
-                            # Parse only title to be fast
-                            if '<title>' in response.text and '<title>' in homepage_html:
-                                res_title_start = response.text.find('<title>') + 7
-                                res_title_end = response.text.find('</title>', res_title_start)
-                                res_title = response.text[res_title_start:res_title_end].strip()
-
-                                home_title_start = homepage_html.find('<title>') + 7
-                                home_title_end = homepage_html.find('</title>', home_title_start)
-                                home_title = homepage_html[home_title_start:home_title_end].strip()
-
-                                if res_title and res_title == home_title:
-                                    print(f"      ⚠️ Rejected: Page title identical to Homepage (Soft 404): {pattern}")
-                                    return None
-                        except Exception:
-                            pass # Fallback if parsing fails
-
-                    print(f"      ✅ Search pattern verified: {pattern}")
-                    return pattern
-                else:
-                    print(f"      ⚠️ Search pattern returned {response.status_code}: {pattern}")
+                if final_url == homepage_url_https or final_url == homepage_url_http:
+                    print(f"      ⚠️ Rejected: Redirected to homepage (Soft 404): {pattern}")
                     return None
 
+                # --- Check 2: Is content identical to homepage? (Soft 404 with same URL) ---
+                if homepage_html:
+                    # Simple heuristic: Compare Page Titles
+                    try:
+                        # Parse only title to be fast
+                        if '<title>' in response.text and '<title>' in homepage_html:
+                            res_title_start = response.text.find('<title>') + 7
+                            res_title_end = response.text.find('</title>', res_title_start)
+                            res_title = response.text[res_title_start:res_title_end].strip()
+
+                            home_title_start = homepage_html.find('<title>') + 7
+                            home_title_end = homepage_html.find('</title>', home_title_start)
+                            home_title = homepage_html[home_title_start:home_title_end].strip()
+
+                            if res_title and res_title == home_title:
+                                print(f"      ⚠️ Rejected: Page title identical to Homepage (Soft 404): {pattern}")
+                                return None
+                    except Exception:
+                        pass # Fallback if parsing fails
+
+                print(f"      ✅ Search pattern verified: {pattern}")
+                return pattern
+            else:
+                print(f"      ⚠️ Search pattern returned {response.status_code}: {pattern}")
+                return None
+
         except Exception as e:
             print(f"      ⚠️ Search pattern test failed: {e}")
             return None
@@ -268,7 +266,7 @@ Return ONLY JSON: {\"search_url_pattern\": \"https://domain.com/search?q={keywor
             
             for selector in candidates:
                 try:
-                    element = soup.select_one(selector)
+                    element = compile_selector(selector).select_one(soup)
                     if not element:
                         continue
                         
@@ -2,6 +2,7 @@ import re
 from typing import Dict, List, Optional
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
+from app.core.selectors import compile_selector
 
 _DATE_PATH_RE = re.compile(r"/20\d{2}/\d{2}/\d{2}/")
 _ARTICLE_ID_RE = re.compile(r"(?:article|art)\d{5,}|/\d{6,}(?:[./-]|$)", re.IGNORECASE)
@@ -127,7 +128,7 @@ class HeuristicAnalyzer:
             'main h1'
         ]
         for selector in title_candidates:
-            if soup.select_one(selector):
+            if compile_selector(selector).select_one(soup):
                 title_selector = selector
                 break
 
@@ -142,7 +143,7 @@ class HeuristicAnalyzer:
             'article'
         ]
         for selector in content_candidates:
-            if soup.select_one(selector):
+            if compile_selector(selector).select_one(soup):
                 content_selector = selector
                 break
 
@@ -157,7 +158,7 @@ class HeuristicAnalyzer:
             'article time'
         ]
         for selector in date_candidates:
-            if soup.select_one(selector):
+            if compile_selector(selector).select_one(soup):
                 date_selector = selector
                 break
 
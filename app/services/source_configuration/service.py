@@ -1,4 +1,3 @@
-import httpx
 import asyncio
 from urllib.parse import urljoin, urlparse
 from typing import Dict, Optional, List
@@ -9,6 +8,7 @@ from app.schemas.source_config import (
     SourceConfigAnalysisResponse
 )
 from app.crud.supabase_crud import SupabaseCRUD
+from app.services.scraping.core.http_client import get_shared_async_client
 from app.services.source_configuration.analyzers.ai_analyzer import AIAnalyzer
 from app.services.source_configuration.analyzers.heuristic_analyzer import HeuristicAnalyzer
 
@@ -77,11 +77,11 @@ class SourceConfigService:
         Raises:
             httpx.HTTPError: If the request fails
         """
-        async with httpx.AsyncClient(timeout=TIMEOUT_SECONDS) as client:
-            headers = {"User-Agent": USER_AGENT}
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
-            return response.text, str(response.url)
+        client = get_shared_async_client()
+        headers = {"User-Agent": USER_AGENT}
+        response = await client.get(url, headers=headers, follow_redirects=True, timeout=TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return response.text, str(response.url)
 
     async def _fetch_html_playwright(self, url: str) -> Optional[tuple[str, str]]:
         """
@@ -181,20 +181,20 @@ class SourceConfigService:
 
         # 2. Sitemaps from robots.txt
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(
-                    f"{root_url}/robots.txt",
-                    headers={"User-Agent": USER_AGENT},
-                    follow_redirects=True,
-                )
-                if resp.status_code == 200:
-                    for line in resp.text.splitlines():
-                        if line.lower().startswith("sitemap:"):
-                            candidate = line.split(":", 1)[1].strip()
-                            if "news" in candidate.lower() and not news_sitemap_url:
-                                news_sitemap_url = candidate
-                            elif not sitemap_url:
-                                sitemap_url = candidate
+            resp = await get_shared_async_client().get(
+                f"{root_url}/robots.txt",
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                timeout=10,
+            )
+            if resp.status_code == 200:
+                for line in resp.text.splitlines():
+                    if line.lower().startswith("sitemap:"):
+                        candidate = line.split(":", 1)[1].strip()
+                        if "news" in candidate.lower() and not news_sitemap_url:
+                            news_sitemap_url = candidate
+                        elif not sitemap_url:
+                            sitemap_url = candidate
         except Exception:
             pass
 
@@ -0,0 +1,49 @@
+-- Migration: Denormalize brand owner onto topics so ownership checks need no brand join
+
+ALTER TABLE topics
+ADD COLUMN IF NOT EXISTS profile_id UUID REFERENCES profiles(id) ON DELETE CASCADE;
+
+-- Backfill from the owning brand
+UPDATE topics t
+SET profile_id = b.profile_id
+FROM brands b
+WHERE b.id = t.brand_id
+  AND t.profile_id IS DISTINCT FROM b.profile_id;
+
+-- Keep it in sync on every insert and update, whichever client writes the row: the
+-- value is always recomputed from the brand, so a direct write to topics.profile_id
+-- cannot change the owner the API authorizes against
+CREATE OR REPLACE FUNCTION set_topic_profile_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT profile_id INTO NEW.profile_id FROM brands WHERE id = NEW.brand_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_topics_profile_id ON topics;
+CREATE TRIGGER trg_topics_profile_id
+BEFORE INSERT OR UPDATE ON topics
+FOR EACH ROW EXECUTE FUNCTION set_topic_profile_id();
+
+-- Follow brand ownership changes. SECURITY DEFINER so the topics are updated even
+-- though RLS would no longer let the caller touch them once the brand moved.
+CREATE OR REPLACE FUNCTION sync_brand_topics_profile_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE topics SET profile_id = NEW.profile_id WHERE brand_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trg_brands_sync_topics_profile_id ON brands;
+CREATE TRIGGER trg_brands_sync_topics_profile_id
+AFTER UPDATE OF profile_id ON brands
+FOR EACH ROW
+WHEN (OLD.profile_id IS DISTINCT FROM NEW.profile_id)
+EXECUTE FUNCTION sync_brand_topics_profile_id();
+
+CREATE INDEX IF NOT EXISTS idx_topics_profile_id_brand_id
+ON topics(profile_id, brand_id);
+
+COMMENT ON COLUMN topics.profile_id IS 'Owner of the parent brand (maintained by trg_topics_profile_id and trg_brands_sync_topics_profile_id)';
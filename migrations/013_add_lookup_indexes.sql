@@ -0,0 +1,12 @@
+-- Migration: Indexes matching the filters the API and scraper actually send
+
+-- Recent mentions of a brand (historical dedup, digests): brand_id = ? AND created_at >= ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS idx_mentions_brand_id_created_at
+ON mentions(brand_id, created_at DESC);
+
+-- Keyword -> topics side of the junction (the primary key only covers lookups by topic_id)
+CREATE INDEX IF NOT EXISTS idx_topic_keywords_keyword_id
+ON topic_keywords(keyword_id);
+
+-- Ownership lookups (brands.profile_id, topics.brand_id) and topics(profile_id, brand_id) are
+-- already covered by idx_brands_profile_id, idx_topics_brand_id and migration 012.
@@ -0,0 +1,9 @@
+-- Migration: Index for keyset pagination of the mentions list
+-- GET /mentions orders by created_at DESC, id DESC within the user's brands and pages with
+-- (created_at, id) < (cursor_created_at, cursor_id); this index serves both the order and the cursor.
+
+CREATE INDEX IF NOT EXISTS idx_mentions_brand_id_created_at_id
+ON mentions(brand_id, created_at DESC, id DESC);
+
+-- Superseded: the new index has the same leading columns
+DROP INDEX IF EXISTS idx_mentions_brand_id_created_at;
@@ -0,0 +1,17 @@
+-- Migration: Bump chats.updated_at from the database when a message is added, so
+-- create_message is a single INSERT instead of an INSERT plus an UPDATE round-trip
+
+CREATE OR REPLACE FUNCTION touch_chat_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE chats SET updated_at = now() WHERE id = NEW.chat_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_messages_touch_chat ON messages;
+CREATE TRIGGER trg_messages_touch_chat
+AFTER INSERT ON messages
+FOR EACH ROW EXECUTE FUNCTION touch_chat_updated_at();
+
+COMMENT ON COLUMN chats.updated_at IS 'Time of the latest message (maintained by trg_messages_touch_chat)';
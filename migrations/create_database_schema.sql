@@ -33,6 +33,7 @@ CREATE TABLE brands (
 CREATE TABLE topics (
     id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
     brand_id BIGINT NOT NULL REFERENCES brands(id) ON DELETE CASCADE,
+    profile_id UUID REFERENCES profiles(id) ON DELETE CASCADE, -- brand owner, set by trg_topics_profile_id
     name TEXT NOT NULL,
     query_template TEXT,
     is_active BOOLEAN DEFAULT TRUE,
@@ -93,8 +94,11 @@ CREATE INDEX idx_brands_profile_id ON brands(profile_id);
 CREATE INDEX idx_brands_scrape_in_progress ON brands(scrape_in_progress);
 CREATE INDEX idx_brands_scrape_started_at ON brands(scrape_started_at);
 CREATE INDEX idx_topics_brand_id ON topics(brand_id);
+CREATE INDEX idx_topics_profile_id_brand_id ON topics(profile_id, brand_id);
+CREATE INDEX idx_topic_keywords_keyword_id ON topic_keywords(keyword_id);
 CREATE INDEX idx_mentions_platform_id ON mentions(platform_id);
 CREATE INDEX idx_mentions_brand_id ON mentions(brand_id);
+CREATE INDEX idx_mentions_brand_id_created_at_id ON mentions(brand_id, created_at DESC, id DESC);
 CREATE INDEX idx_mentions_topic_id ON mentions(topic_id);
 CREATE INDEX idx_mentions_primary_keyword_id ON mentions(primary_keyword_id);
 CREATE INDEX idx_mentions_published_at ON mentions(published_at);
@@ -313,3 +317,31 @@ $$ LANGUAGE plpgsql SECURITY DEFINER;
 CREATE TRIGGER on_auth_user_created
     AFTER INSERT ON auth.users
     FOR EACH ROW EXECUTE FUNCTION public.handle_new_user();
+
+-- Keep topics.profile_id in sync with the owning brand (recomputed on every write)
+CREATE OR REPLACE FUNCTION set_topic_profile_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT profile_id INTO NEW.profile_id FROM brands WHERE id = NEW.brand_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_topics_profile_id
+    BEFORE INSERT OR UPDATE ON topics
+    FOR EACH ROW EXECUTE FUNCTION set_topic_profile_id();
+
+-- ...and follow brand ownership changes
+CREATE OR REPLACE FUNCTION sync_brand_topics_profile_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE topics SET profile_id = NEW.profile_id WHERE brand_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER trg_brands_sync_topics_profile_id
+    AFTER UPDATE OF profile_id ON brands
+    FOR EACH ROW
+    WHEN (OLD.profile_id IS DISTINCT FROM NEW.profile_id)
+    EXECUTE FUNCTION sync_brand_topics_profile_id();
@@ -25,6 +25,7 @@ load_dotenv()
 
 from app.core.supabase_client import get_supabase_admin
 from app.crud.supabase_crud import SupabaseCRUD
+from app.services.scraping.core.http_client import close_shared_async_client
 from app.services.scraping.pipeline import BrandScrapeResult, process_brand_scrape
 
 
@@ -96,6 +97,8 @@ def _brand_due_for_scrape(brand: Dict, now: datetime) -> bool:
 
 async def _scrape_due_brands(brands_to_scrape: List[Dict], crud: SupabaseCRUD) -> List[BrandScrapeResult]:
     results: List[BrandScrapeResult] = []
+    # Full brand rows for every due brand in one request instead of one get_brand per scrape
+    full_brands = await crud.get_brands_in([int(brand["id"]) for brand in brands_to_scrape])
 
     for brand in brands_to_scrape:
         brand_id = int(brand["id"])
@@ -106,6 +109,7 @@ async def _scrape_due_brands(brands_to_scrape: List[Dict], crud: SupabaseCRUD) -
             scrape_run_id=run_id,
             apply_relevance_filter=True,
             acquire_lock=True,
+            brand=full_brands.get(brand_id),
         )
         results.append(result)
 
@@ -143,6 +147,17 @@ async def main() -> None:
         now = datetime.now(timezone.utc)
         brands_to_scrape = [brand for brand in brands if _brand_due_for_scrape(brand, now)]
 
+        if brands_to_scrape:
+            brand_ids_with_keywords = await crud.get_brand_ids_with_keywords(
+                [int(brand["id"]) for brand in brands_to_scrape]
+            )
+            for brand in brands_to_scrape:
+                if int(brand["id"]) not in brand_ids_with_keywords:
+                    logger.info("'%s': no keywords configured, skipping", brand.get("name", "unknown"))
+            brands_to_scrape = [
+                brand for brand in brands_to_scrape if int(brand["id"]) in brand_ids_with_keywords
+            ]
+
         if not brands_to_scrape:
             logger.info("No brands are due for scraping at this time.")
             return
@@ -177,6 +192,8 @@ async def main() -> None:
     except Exception as exc:
         logger.critical("FATAL ERROR: %s", exc, exc_info=True)
         sys.exit(1)
+    finally:
+        await close_shared_async_client()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Settings() requires these at import time; tests never talk to the real services.
+for _name in ("SUPABASE_KEY", "SUPABASE_SERVICE_ROLE_KEY", "DEEPSEEK_API_KEY", "GNEWS_API_KEY", "SERPAPI_KEY"):
+    os.environ.setdefault(_name, "test")
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
@@ -0,0 +1,46 @@
+import asyncio
+
+from bs4 import BeautifulSoup
+
+from app.services.scraping.providers.configurable.extractor import _extract_content, _extract_generic_sync
+
+ARTICLE_BODY = "Fonden uddeler i år millioner til forskning i grøn omstilling. " * 3
+
+XHTML_PAGE = (
+    '<?xml version="1.0" encoding="{encoding}"?>\n'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
+    '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Side</title></head><body>'
+    "<article><h1>Grøn fond åbner</h1>"
+    '<time datetime="2026-10-15T10:00:00Z">15. oktober</time>'
+    '<div class="article-body"><p>{body}</p></div></article>'
+    "</body></html>"
+)
+
+
+def test_generic_extraction_handles_xml_declared_pages():
+    for encoding in ("utf-8", "iso-8859-1"):
+        html = XHTML_PAGE.format(encoding=encoding, body=ARTICLE_BODY)
+
+        title, content, date_str, date_confident = _extract_generic_sync(html, True, True)
+
+        assert title == "Grøn fond åbner"
+        assert content == ARTICLE_BODY.strip()
+        assert (date_str, date_confident) == ("2026-10-15T10:00:00Z", True)
+
+
+def test_extract_content_uses_generic_fallback_for_xml_declared_pages():
+    html = XHTML_PAGE.format(encoding="utf-8", body=ARTICLE_BODY)
+
+    title, content, date_str, _, extracted_via = asyncio.run(
+        _extract_content(BeautifulSoup(html, "lxml"), html, None)
+    )
+
+    assert extracted_via == "generic"
+    assert title == "Grøn fond åbner"
+    assert content == ARTICLE_BODY.strip()
+    assert date_str == "2026-10-15T10:00:00Z"
+
+
+def test_generic_extraction_of_empty_document_is_empty():
+    assert _extract_generic_sync("  ", True, True) == ("", "", "", False)